@@ -0,0 +1,102 @@
+"""
++---------------------------------------------------------------+
+|        Benchmark: JSON- gegen binäres Steuerprotokoll         |
+|---------------------------------------------------------------|
+| Dieses Skript startet den lokalen Simulator und misst die     |
+| Antwortzeiten (Round-Trip) von get_pos und set_position       |
+| mit beiden Protokollen. Zum Schluss wird get_pos mit          |
+| Positions-Stream gemessen (keine Abfrage mehr nötig).         |
+|                                                               |
+| Mit SUS_IP=... kann stattdessen eine echte Kamera             |
+| gemessen werden: python examples/benchmark_protocol.py --real |
++---------------------------------------------------------------+
+"""
+
+import sys
+import os
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dotenv import load_dotenv
+from tools.cam import Camera
+from tools.simulator import CameraSimulator
+
+load_dotenv()  # Umgebungsvariablen laden
+
+ROUNDS = 500   # Messungen pro Befehl
+
+
+# Misst eine Coroutine-Funktion ROUNDS-mal und gibt die Zeiten in Mikrosekunden zurück
+async def measure(func):
+    times = []
+    for i in range(ROUNDS):
+        start = time.perf_counter()
+        await func(i)
+        times.append((time.perf_counter() - start) * 1e6)
+    return times
+
+
+def report(name, times):
+    times = sorted(times)
+    p99 = times[int(len(times) * 0.99) - 1]
+    print(f"{name:<34} Mittel {statistics.mean(times):8.1f} µs   "
+          f"Median {statistics.median(times):8.1f} µs   p99 {p99:8.1f} µs")
+
+
+async def bench(ip, protocol):
+    # Die Kamera-Klasse gibt bei jedem Befehl Text aus, das würde die Messung verfälschen
+    with contextlib.redirect_stdout(io.StringIO()):
+        cam = Camera(ip, protocol=protocol)
+        await cam.connect()
+        fallback = cam.is_fallback()
+    try:
+        if fallback:
+            print("Keine Verbindung zur Kamera, Benchmark abgebrochen.")
+            return
+        print(f"\nProtokoll: {cam.protocol}")
+        report("get_pos", await measure(lambda i: cam.get_pos()))
+
+        # set_position hat keine Antwort: get_pos danach wartet auf die Ausführung
+        async def move(i):
+            with contextlib.redirect_stdout(io.StringIO()):
+                await cam.set_position(80 + i % 20, 40 + i % 10)
+            await cam.get_pos()
+        report("set_position + get_pos", await measure(move))
+
+        if await cam.start_position_stream():
+            await asyncio.sleep(0.1)  # erste Position abwarten
+            report("get_pos (Positions-Stream)", await measure(lambda i: cam.get_pos()))
+            await cam.stop_position_stream()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await cam.close()
+
+
+async def main():
+    if "--real" in sys.argv:
+        ip = os.getenv("SUS_IP", "127.0.0.1")
+        simulator = None
+    else:
+        # Simulator ohne Bild-Stream, damit nur die Steuerung gemessen wird
+        simulator = CameraSimulator(port=8766, fps=0)
+        started = asyncio.Event()
+        server = asyncio.create_task(simulator.run(started))
+        await started.wait()
+        ip = f"{simulator.host}:{simulator.port}"
+
+    await bench(ip, "json")
+    await bench(ip, "auto")
+
+    if simulator is not None:
+        server.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await server
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
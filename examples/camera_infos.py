@@ -22,19 +22,15 @@ load_dotenv()  # Umgebungsvariablen laden
 
 async def main():
     sus_ip = os.getenv("SUS_IP", "127.0.0.1")
-    cam = Camera(sus_ip)
-    await cam.connect()
+    async with Camera(sus_ip) as cam:  # Verbindung wird am Ende automatisch geschlossen
+        pos = await cam.get_pos()
+        print("Aktuelle Position:", pos)
 
-    pos = await cam.get_pos()
-    print("Aktuelle Position:", pos)
+        limits = await cam.get_limits()
+        print("Positions-Limits:", limits)
 
-    limits = await cam.get_limits()
-    print("Positions-Limits:", limits)
-
-    clients = await cam.client_count()
-    print("Anzahl verbundener Clients:", clients)
-
-    await cam.close()  # Stelle sicher, dass dies eine async def ist!
+        clients = await cam.client_count()
+        print("Anzahl verbundener Clients:", clients)
 
 
 if __name__ == "__main__":
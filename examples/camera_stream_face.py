@@ -15,6 +15,7 @@
 |   und Bildmittelpunkt                                         |
 | - Anzeige der Erkennungsgenauigkeit (Konfidenz)               |
 | - Statusanzeige im Bild                                       |
+| - Optional: Ausgabe als virtuelle Kamera (SUS_VIRTUALCAM=1)   |
 |                                                               |
 | Steuerung:                                                    |
 | - Mit der Taste 'q' kann das Programm beendet werden          |
@@ -30,6 +31,8 @@ import numpy as np
 from PIL import Image
 from dotenv import load_dotenv
 from tools.cam import Camera
+from tools.frame_cache import FrameCache
+from tools.virtualcam import VirtualCamSink
 import mediapipe as mp
 
 load_dotenv()  # Lädt Umgebungsvariablen aus einer .env-Datei
@@ -38,10 +41,40 @@ load_dotenv()  # Lädt Umgebungsvariablen aus einer .env-Datei
 mp_face_detection = mp.solutions.face_detection
 mp_drawing = mp.solutions.drawing_utils
 
+# Gesichtserkennung einmal erzeugen statt für jedes Bild neu
+face_detection = mp_face_detection.FaceDetection(
+    model_selection=0,  # 0: Nahbereich-Modell für Gesichter nahe an der Kamera
+    min_detection_confidence=0.5  # Erkennungsschwellwert (0.0-1.0)
+)
+
+# Cache nur für erkannte Gesichter (optional auch auf der Festplatte). Live-Bilder
+# wiederholen sich praktisch nie, dekodierte Bilder zu cachen würde nur Speicher kosten
+frame_cache = FrameCache(max_items=256, disk_dir=os.getenv("SUS_CACHE_DIR") or None)
+frame_key = None  # Schlüssel des aktuellen Bildes, gesetzt im JPEG-Callback
+
+# Virtuelle Kamera für das bearbeitete Bild, wird beim ersten Bild in passender Größe gestartet
+virtualcam_enabled = os.getenv("SUS_VIRTUALCAM", "0") == "1"
+virtualcam = None
+
+# Erkennt Gesichter in einem RGB-Bild und gibt sie als einfache Tupel zurück
+# (xmin, ymin, breite, höhe, konfidenz), damit sie sich cachen lassen
+def detect_faces(img_rgb: np.ndarray):
+    results = face_detection.process(img_rgb)
+    faces = []
+    for detection in results.detections or []:
+        bbox = detection.location_data.relative_bounding_box
+        faces.append((bbox.xmin, bbox.ymin, bbox.width, bbox.height, detection.score[0]))
+    return faces
+
 # Callback-Funktion für Statusinformationen von der Kamera
 def my_msg_callback(msg: str, cam: Camera):
     print("Neue Kamera-Nachricht:", msg)
 
+# Callback-Funktion für die JPEG-Bytes: merkt sich den Cache-Schlüssel des Bildes
+def my_jpeg_callback(data: bytes, cam: Camera):
+    global frame_key
+    frame_key = FrameCache.key(data)
+
 # Callback-Funktion für Bildverarbeitung
 def my_img_callback(img: Image.Image, cam: Camera):
     # Bild von PIL.Image-Format zu NumPy-Array für OpenCV konvertieren
@@ -49,63 +82,65 @@ def my_img_callback(img: Image.Image, cam: Camera):
     # Farbkanäle von RGB (PIL-Standard) zu BGR (OpenCV-Standard) umwandeln
     img_bgr = cv2.cvtColor(img_np, cv2.COLOR_RGB2BGR)
 
-    # MediaPipe Face Detection für das aktuelle Bild anwenden
-    with mp_face_detection.FaceDetection(
-            model_selection=0,  # 0: Nahbereich-Modell für Gesichter nahe an der Kamera
-            min_detection_confidence=0.5  # Erkennungsschwellwert (0.0-1.0)
-    ) as face_detection:
-        # Bild für MediaPipe von BGR zurück zu RGB konvertieren (MediaPipe erwartet RGB)
-        img_rgb = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB)
-        results = face_detection.process(img_rgb)
-
-        # Verarbeitung der erkannten Gesichter
-        if results.detections:
-            for detection in results.detections:
-                # Begrenzungsrahmen (Bounding Box) des Gesichts extrahieren
-                bboxC = detection.location_data.relative_bounding_box
-                h, w, _ = img_bgr.shape
-
-                # Relative Koordinaten in absolute Pixelkoordinaten umrechnen
-                x = int(bboxC.xmin * w)
-                y = int(bboxC.ymin * h)
-                width = int(bboxC.width * w)
-                height = int(bboxC.height * h)
-
-                # Grünes Rechteck um das erkannte Gesicht zeichnen
-                cv2.rectangle(img_bgr, (x, y), (x + width, y + height), (0, 255, 0), 2)
-
-                # Zentrum des erkannten Gesichts berechnen und als roter Punkt markieren
-                face_center_x = x + width // 2
-                face_center_y = y + height // 2
-                cv2.circle(img_bgr, (face_center_x, face_center_y), 5, (0, 0, 255), -1)
-
-                # Bildmittelpunkt berechnen und als roter Punkt markieren
-                img_center_x = img_rgb.shape[1] // 2
-                img_center_y = img_rgb.shape[0] // 2
-                cv2.circle(img_bgr, (img_center_x, img_center_y), 5, (0, 0, 255), -1)
-
-                # Blaue Linie zwischen Gesichtszentrum und Bildmittelpunkt zeichnen
-                cv2.line(img_bgr, (face_center_x, face_center_y), (img_center_x, img_center_y), (255, 0, 0), 2)
-
-                face_diff_x = face_center_x - img_center_x
-                face_diff_y = face_center_y - img_center_y
-
-                # Zeigt die Differenz zwischen Gesichtszentrum und Bildzentrum an
-                cv2.putText(img_bgr, f"Diff X: {face_diff_x}, Y: {face_diff_y}", (50, 80),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-                # Erkennungsgenauigkeit (Konfidenz) im Bild anzeigen
-                confidence = detection.score[0]
-                cv2.putText(img_bgr, f"Konfidenz: {confidence:.2f}", (x, y - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-
-                # Statusmeldung im Bild anzeigen und in Konsole ausgeben
-                cv2.putText(img_bgr, "Gesicht erkannt", (50, 50),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-        else:
-            # Statusmeldung wenn kein Gesicht erkannt wurde
-            cv2.putText(img_bgr, "Kein Gesicht erkannt", (50, 50),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+    # Gesichter erkennen – bei bereits bekanntem Bildinhalt direkt aus dem Cache
+    if frame_key is not None:
+        faces = frame_cache.get_or_compute(frame_key, "faces", lambda: detect_faces(img_np))
+    else:
+        faces = detect_faces(img_np)
+
+    # Verarbeitung der erkannten Gesichter
+    if faces:
+        for xmin, ymin, box_w, box_h, confidence in faces:
+            h, w, _ = img_bgr.shape
+
+            # Relative Koordinaten in absolute Pixelkoordinaten umrechnen
+            x = int(xmin * w)
+            y = int(ymin * h)
+            width = int(box_w * w)
+            height = int(box_h * h)
+
+            # Grünes Rechteck um das erkannte Gesicht zeichnen
+            cv2.rectangle(img_bgr, (x, y), (x + width, y + height), (0, 255, 0), 2)
+
+            # Zentrum des erkannten Gesichts berechnen und als roter Punkt markieren
+            face_center_x = x + width // 2
+            face_center_y = y + height // 2
+            cv2.circle(img_bgr, (face_center_x, face_center_y), 5, (0, 0, 255), -1)
+
+            # Bildmittelpunkt berechnen und als roter Punkt markieren
+            img_center_x = img_bgr.shape[1] // 2
+            img_center_y = img_bgr.shape[0] // 2
+            cv2.circle(img_bgr, (img_center_x, img_center_y), 5, (0, 0, 255), -1)
+
+            # Blaue Linie zwischen Gesichtszentrum und Bildmittelpunkt zeichnen
+            cv2.line(img_bgr, (face_center_x, face_center_y), (img_center_x, img_center_y), (255, 0, 0), 2)
+
+            face_diff_x = face_center_x - img_center_x
+            face_diff_y = face_center_y - img_center_y
+
+            # Zeigt die Differenz zwischen Gesichtszentrum und Bildzentrum an
+            cv2.putText(img_bgr, f"Diff X: {face_diff_x}, Y: {face_diff_y}", (50, 80),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+
+            # Erkennungsgenauigkeit (Konfidenz) im Bild anzeigen
+            cv2.putText(img_bgr, f"Konfidenz: {confidence:.2f}", (x, y - 10),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+
+            # Statusmeldung im Bild anzeigen und in Konsole ausgeben
+            cv2.putText(img_bgr, "Gesicht erkannt", (50, 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    else:
+        # Statusmeldung wenn kein Gesicht erkannt wurde
+        cv2.putText(img_bgr, "Kein Gesicht erkannt", (50, 50),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+
+    # Bearbeitetes Bild an die virtuelle Kamera weitergeben (blockiert nicht)
+    global virtualcam
+    if virtualcam_enabled:
+        if virtualcam is None:
+            h, w, _ = img_bgr.shape
+            virtualcam = VirtualCamSink(w, h, fps=int(os.getenv("SUS_VIRTUALCAM_FPS", "20"))).start()
+        virtualcam.push(img_bgr, bgr=True)
 
     # Aktuelles Bild mit Visualisierungen im Fenster anzeigen
     cv2.imshow("Kamera-Stream mit Gesichtserkennung", img_bgr)
@@ -115,15 +150,23 @@ def my_img_callback(img: Image.Image, cam: Camera):
     # Programm beenden wenn 'q' gedrückt wird
     if key & 0xFF == ord('q'):
         cv2.destroyAllWindows()
+        print("Cache-Statistik:", frame_cache.stats())
+        if virtualcam:
+            print("Virtuelle Kamera:", virtualcam.stats())
+            virtualcam.stop()
         exit(0)
 
 # Hauptfunktion: Kameraverbindung herstellen und Verarbeitung starten
 async def main():
     sus_ip = os.getenv("SUS_IP", "127.0.0.1") # Standard-IP der Kamera aus Umgebungsvariablen lesen
-    cam = Camera(sus_ip)  # Kamera-Objekt mit der angegebenen IP initialisieren
+    # Detektoren brauchen kein Vollbild: optional verkleinert dekodieren (1, 2, 4 oder 8)
+    decode_scale = int(os.getenv("SUS_DECODE_SCALE", "1"))
+    # Kamera-Objekt mit der angegebenen IP initialisieren
+    cam = Camera(sus_ip, decode_scale=decode_scale)
 
     # Callbacks für Kameranachrichten und Bildverarbeitung registrieren
     cam.set_msg_callback(my_msg_callback)
+    cam.set_jpeg_callback(my_jpeg_callback)
     cam.set_img_callback(my_img_callback)
 
     # Verbindung zur Kamera herstellen
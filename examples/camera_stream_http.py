@@ -0,0 +1,57 @@
+"""
++---------------------------------------------------------------+
+|            Kamera-Stream im Browser (MJPEG über HTTP)         |
+|---------------------------------------------------------------|
+| Dieses Skript verbindet sich mit einer Kamera und stellt den  |
+| Stream per HTTP bereit – ganz ohne OpenCV-Fenster.            |
+|                                                               |
+| - http://localhost:8080/               Übersichtsseite        |
+| - http://localhost:8080/stream.mjpg    Originalbilder         |
+| - http://localhost:8080/annotated.mjpg Mit Fadenkreuz         |
+|                                                               |
+| Der Port kann mit SUS_HTTP_PORT geändert werden.              |
++---------------------------------------------------------------+
+"""
+
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PIL import Image, ImageDraw
+from dotenv import load_dotenv
+from tools.cam import Camera
+from tools.mjpeg_server import MjpegServer
+
+load_dotenv()  # Umgebungsvariablen laden
+
+
+# Zeichnet ein Fadenkreuz in die Bildmitte
+def annotate(img: Image.Image):
+    img = img.copy()
+    draw = ImageDraw.Draw(img)
+    w, h = img.size
+    draw.line((w // 2 - 20, h // 2, w // 2 + 20, h // 2), fill=(255, 0, 0), width=2)
+    draw.line((w // 2, h // 2 - 20, w // 2, h // 2 + 20), fill=(255, 0, 0), width=2)
+    draw.text((10, h - 20), "SUSCam", fill=(255, 255, 255))
+    return img
+
+
+async def main():
+    sus_ip = os.getenv("SUS_IP", "127.0.0.1")
+    port = int(os.getenv("SUS_HTTP_PORT", "8080"))
+
+    async with Camera(sus_ip) as cam:
+        server = MjpegServer(cam, port=port, annotate=annotate)
+        try:
+            await server.serve_forever()      # Läuft, bis Strg+C gedrückt wird
+        finally:
+            await server.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
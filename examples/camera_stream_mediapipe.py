@@ -6,6 +6,11 @@
 | den Live-Stream im Fenster an. Hände werden mit MediaPipe     |
 | erkannt und im Bild markiert.                                 |
 |                                                               |
+| Gestensteuerung („Hand zeigen = Kamera schwenkt“):            |
+| - Offene Hand: Kamera folgt der Hand                          |
+| - Faust: Pause                                                |
+| - Zeigefinger: Kamera zentrieren                              |
+|                                                               |
 | - Die Kamera-IP wird aus einer Umgebungsvariable gelesen.     |
 | - Bilder werden mit OpenCV angezeigt.                         |
 | - Mit der Taste 'q' kann das Fenster geschlossen werden.      |
@@ -14,6 +19,7 @@
 
 import sys
 import os
+import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import cv2
@@ -22,6 +28,7 @@ import numpy as np
 from PIL import Image
 from dotenv import load_dotenv
 from tools.cam import Camera
+from tools.gesture import GestureController, landmarks_to_array
 import mediapipe as mp
 
 load_dotenv()  # Lädt Umgebungsvariablen aus einer .env-Datei
@@ -30,33 +37,48 @@ load_dotenv()  # Lädt Umgebungsvariablen aus einer .env-Datei
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 
+# Hands-Objekt einmal erzeugen: im Videomodus verfolgt MediaPipe die Hände
+# über mehrere Bilder, das ist schneller als jedes Bild neu zu erkennen
+hands = mp_hands.Hands(
+    static_image_mode=False,         # Für Videostreams: False
+    max_num_hands=2,                 # Maximal 2 Hände erkennen
+    min_detection_confidence=0.5     # Mindest-Konfidenz für Erkennung
+)
+
+# Gestensteuerung, wird in main() mit der Kamera verbunden
+controller = None
+
 # Callback-Funktion für empfangene Nachrichten von der Kamera
 def my_msg_callback(msg: str, cam: Camera):
     print("Neue Nachricht:", msg)
 
 # Callback-Funktion für empfangene Bilder von der Kamera
 def my_img_callback(img: Image.Image, cam: Camera):
+    t_frame = time.perf_counter()  # Zeitpunkt des Bildeingangs für die Latenzmessung
+
     # Bild von PIL.Image zu NumPy-Array konvertieren
     img_np = np.array(img)
     # Farbkanäle von RGB (PIL) zu BGR (OpenCV) umwandeln
     img_bgr = cv2.cvtColor(img_np, cv2.COLOR_RGB2BGR)
 
-    # MediaPipe Hands-Objekt für die Handerkennung erzeugen
-    # Wird für jedes Bild neu erzeugt (alternativ: global initialisieren für Effizienz)
-    with mp_hands.Hands(
-        static_image_mode=False,         # Für Videostreams: False
-        max_num_hands=2,                # Maximal 2 Hände erkennen
-        min_detection_confidence=0.5     # Mindest-Konfidenz für Erkennung
-    ) as hands:
-        # Bild für MediaPipe von BGR zurück zu RGB konvertieren
-        results = hands.process(img_np)
-        # Wenn mindestens eine Hand erkannt wurde
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Zeichnet die erkannten Hand-Landmarks und Verbindungen ins Bild
-                mp_drawing.draw_landmarks(
-                    img_bgr, hand_landmarks, mp_hands.HAND_CONNECTIONS
-                )
+    # MediaPipe erwartet RGB, img_np ist bereits RGB
+    results = hands.process(img_np)
+    # Wenn mindestens eine Hand erkannt wurde
+    if results.multi_hand_landmarks:
+        for hand_landmarks in results.multi_hand_landmarks:
+            # Zeichnet die erkannten Hand-Landmarks und Verbindungen ins Bild
+            mp_drawing.draw_landmarks(
+                img_bgr, hand_landmarks, mp_hands.HAND_CONNECTIONS
+            )
+
+    # Geste auswerten und ggf. Kamera bewegen
+    if controller:
+        controller.process(landmarks_to_array(results.multi_hand_landmarks), t_frame)
+        stats = controller.latency_stats()
+        status = f"Modus: {controller.state}"
+        if stats["count"]:
+            status += f"  Latenz: {stats['mean_ms']:.1f} ms"
+        cv2.putText(img_bgr, status, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
 
     # Zeigt das aktuelle Bild mit erkannten Händen im Fenster an
     cv2.imshow("Kamera-Stream mit MediaPipe", img_bgr)
@@ -65,17 +87,24 @@ def my_img_callback(img: Image.Image, cam: Camera):
     # Wenn die Taste 'q' gedrückt wird, Fenster schließen und Programm beenden
     if key & 0xFF == ord('q'):
         cv2.destroyAllWindows()
+        if controller:
+            print("Gesten-Latenz (Bild bis Befehl):", controller.latency_stats())
         exit(0)
 
 # Hauptfunktion: Verbindet sich mit der Kamera und startet den Stream
 async def main():
     sus_ip = os.getenv("SUS_IP", "127.0.0.1")  # Kamera-IP aus Umgebungsvariable
-    cam = Camera(sus_ip)                       # Kamera-Objekt erzeugen
+    decode_scale = int(os.getenv("SUS_DECODE_SCALE", "1"))  # Verkleinert dekodieren (1, 2, 4, 8)
+    cam = Camera(sus_ip, decode_scale=decode_scale)         # Kamera-Objekt erzeugen
 
     cam.set_msg_callback(my_msg_callback)      # Setzt Callback für Nachrichten
     cam.set_img_callback(my_img_callback)      # Setzt Callback für Bilder
 
     await cam.connect()                        # Stellt Verbindung zur Kamera her
+
+    global controller
+    controller = GestureController(cam)        # Gestensteuerung mit der Kamera verbinden
+    await controller.sync_position()           # Startposition und Grenzen übernehmen
     while True:
         await asyncio.sleep(1)                 # Hält das Programm am Laufen
 
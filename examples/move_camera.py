@@ -16,8 +16,7 @@
 
 import sys
 import os
-import asyncio           # Für asynchrone Steuerung der Kamera
-from time import sleep   # Für kurze Pausen zwischen den Bewegungen
+import asyncio           # Für asynchrone Steuerung der Kamera und kurze Pausen
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -28,25 +27,24 @@ load_dotenv()  # Umgebungsvariablen laden
 
 async def main():
     sus_ip = os.getenv("SUS_IP", "127.0.0.1")  # IP-Adresse der Kamera holen
-    cam = Camera(sus_ip)                       # Kamera-Objekt erstellen
-    await cam.connect()                        # Mit der Kamera verbinden
-
-    print("Kamera verbunden. Starte Bewegungen...")
-
-    print("Bewege Kamera nach rechts...")
-    await cam.right()                          # Kamera nach rechts bewegen
-    sleep(1)                                   # 1 Sekunde warten
-    print("Bewege Kamera nach links...")
-    await cam.left()                           # Kamera nach links bewegen
-    sleep(1)
-    print("Bewege Kamera nach oben...")
-    await cam.up()                             # Kamera nach oben bewegen
-    sleep(1)
-    print("Bewege Kamera nach unten...")
-    await cam.down()                           # Kamera nach unten bewegen
-    sleep(1)
-    print("Centriere Kamera...")
-    await cam.center()                         # Kamera zentrieren
+    # "async with" verbindet mit der Kamera und schließt die Verbindung am Ende
+    async with Camera(sus_ip) as cam:
+        print("Kamera verbunden. Starte Bewegungen...")
+
+        print("Bewege Kamera nach rechts...")
+        await cam.right()                      # Kamera nach rechts bewegen
+        await asyncio.sleep(1)                 # 1 Sekunde warten, ohne zu blockieren
+        print("Bewege Kamera nach links...")
+        await cam.left()                       # Kamera nach links bewegen
+        await asyncio.sleep(1)
+        print("Bewege Kamera nach oben...")
+        await cam.up()                         # Kamera nach oben bewegen
+        await asyncio.sleep(1)
+        print("Bewege Kamera nach unten...")
+        await cam.down()                       # Kamera nach unten bewegen
+        await asyncio.sleep(1)
+        print("Centriere Kamera...")
+        await cam.center()                     # Kamera zentrieren
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -54,3 +52,6 @@ if __name__ == "__main__":
 # Warum asyncio?
 # Viele Kamerafunktionen sind asynchron, weil sie auf Antworten warten müssen.
 # Mit asyncio kann das Programm weiterlaufen, ohne zu blockieren.
+# Deshalb niemals time.sleep() in async-Funktionen verwenden, sondern
+# await asyncio.sleep(). Für einfache, blockierende Skripte gibt es
+# SyncCamera (siehe move_camera_sync.py).
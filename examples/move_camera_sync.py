@@ -0,0 +1,43 @@
+"""
++---------------------------------------------------------------+
+|       Kamera bewegen Beispiel ohne asyncio (SyncCamera)       |
+|---------------------------------------------------------------|
+| Dieses Skript macht dasselbe wie move_camera.py, nutzt aber   |
+| die blockierende SyncCamera. Hier ist time.sleep erlaubt,     |
+| weil die Kamera in einem eigenen Hintergrund-Thread läuft.    |
+|                                                               |
+| Ideal für Einsteiger, die (noch) kein async/await nutzen.     |
++---------------------------------------------------------------+
+"""
+
+import sys
+import os
+from time import sleep   # Blockiert nur dieses Skript, nicht die Kamera
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dotenv import load_dotenv
+from tools.sync_cam import SyncCamera
+
+load_dotenv()  # Umgebungsvariablen laden
+
+
+def main():
+    sus_ip = os.getenv("SUS_IP", "127.0.0.1")  # IP-Adresse der Kamera holen
+
+    with SyncCamera(sus_ip) as cam:            # Verbinden, am Ende automatisch schließen
+        print("Kamera verbunden. Position:", cam.get_pos())
+
+        cam.right()                            # Kamera nach rechts bewegen
+        sleep(1)                               # 1 Sekunde warten
+        cam.left()                             # Kamera nach links bewegen
+        sleep(1)
+        cam.up()                               # Kamera nach oben bewegen
+        sleep(1)
+        cam.down()                             # Kamera nach unten bewegen
+        sleep(1)
+        cam.center()                           # Kamera zentrieren
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
++---------------------------------------------------------------+
+|            Szenen-Scan mit Panorama Beispiel                  |
+|---------------------------------------------------------------|
+| Dieses Skript fährt den gesamten Schwenk-/Neigebereich der    |
+| Kamera ab und setzt die Bilder zu einem Panorama zusammen.    |
+|                                                               |
+| - Das Panorama wächst live im Fenster mit.                    |
+| - Am Ende wird es als panorama.png gespeichert.               |
+| - Ein Klick ins Panorama schwenkt die Kamera genau dorthin.   |
+| - Mit der Taste 'q' wird das Programm beendet.                |
++---------------------------------------------------------------+
+"""
+
+import sys
+import os
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cv2
+import numpy as np
+from dotenv import load_dotenv
+from tools.cam import Camera
+from tools.scan import scan
+
+load_dotenv()  # Umgebungsvariablen laden
+
+WINDOW = "SUSCam Panorama"
+MAX_WIDTH = 1280   # Anzeigebreite des Panoramas im Fenster
+
+
+# Panorama verkleinert im Fenster anzeigen, gibt den Maßstab zurück
+def show(panorama):
+    img = cv2.cvtColor(np.array(panorama.image()), cv2.COLOR_RGB2BGR)
+    scale = min(1.0, MAX_WIDTH / img.shape[1])
+    cv2.imshow(WINDOW, cv2.resize(img, None, fx=scale, fy=scale))
+    cv2.waitKey(1)
+    return scale
+
+
+async def main():
+    sus_ip = os.getenv("SUS_IP", "127.0.0.1")
+
+    async with Camera(sus_ip) as cam:
+        # Während des Scans nach jedem Bild das Panorama neu anzeigen
+        panorama = await scan(cam, on_progress=lambda n, total, pano: show(pano))
+        if panorama is None:
+            print("Keine Bilder erhalten, kein Panorama.")
+            return
+
+        panorama.image().save("panorama.png")
+        print("Panorama gespeichert: panorama.png")
+        scale = show(panorama)
+
+        # Klick ins Panorama: Kamera auf diese Stelle ausrichten
+        targets = []
+        def on_mouse(event, x, y, flags, param):
+            if event == cv2.EVENT_LBUTTONDOWN:
+                targets.append(panorama.angle_at(x / scale, y / scale))
+        cv2.setMouseCallback(WINDOW, on_mouse)
+
+        print("Ins Panorama klicken, um die Kamera auszurichten. 'q' beendet.")
+        while True:
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            while targets:
+                pos = targets.pop(0)
+                await cam.set_position(pos["x"], pos["y"])
+            await asyncio.sleep(0.02)  # Event-Loop nicht blockieren
+
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,9 +7,11 @@
 | kann. Es gibt auch einen Fallback-Modus für lokale Tests.     |
 |                                                               |
 | - Kamera bewegen (up, down, left, right, center, set_position)|
-| - Bilddaten empfangen (mit Callback)                          |
+| - Bilddaten empfangen (mit Callback, optional verkleinert)    |
 | - Licht steuern (light_on, light_off)                         |
 | - Position und Limits abfragen                                |
+| - async with Camera(...) / async for img in cam.frames()      |
+| - Optional binäres Steuerprotokoll mit Positions-Stream       |
 |                                                               |
 | Ideal für Einsteiger und Fortgeschrittene zur Kamerasteuerung.|
 +---------------------------------------------------------------+
@@ -17,16 +19,33 @@
 
 import io
 import json
+import warnings
+from collections import deque
 from PIL import Image
 import asyncio
+import threading
 import websockets
 import time
 
+from tools import protocol as binproto
+
 try:
     import cv2
 except ImportError:
     cv2 = None
 
+# Markiert in den frames()-Warteschlangen das Ende des Streams
+_END_OF_FRAMES = object()
+
+# Maximale Wartezeit (Sekunden) auf eine Antwort der Kamera
+REPLY_TIMEOUT = 5.0
+
+# Wartezeit beim Aushandeln des binären Protokolls, danach gilt JSON
+NEGOTIATE_TIMEOUT = 0.5
+
+# Erlaubte Verkleinerungsfaktoren für das JPEG-Dekodieren (DCT-Skalierung)
+DECODE_SCALES = (1, 2, 4, 8)
+
 # Positions- und Limit-Konstanten
 START_POS_X = 90
 MIN_POS_X = 0
@@ -36,6 +55,27 @@ START_POS_Y = 45
 MIN_POS_Y = 0
 MAX_POS_Y = 90
 
+# Servo-Geschwindigkeit in Grad pro Sekunde und Beruhigungszeit nach jeder Bewegung
+DEFAULT_SPEED = 120.0
+DEFAULT_SETTLE = 0.2
+
+
+def settle_time(old, new, speed=DEFAULT_SPEED, settle=DEFAULT_SETTLE):
+    """
+    Schätzt, wie lange eine Bewegung dauert, bis das Bild ruhig ist.
+
+    Args:
+        old (tuple): Alte Position (x, y).
+        new (tuple): Neue Position (x, y).
+        speed (float): Servo-Geschwindigkeit in Grad pro Sekunde.
+        settle (float): Zusätzliche Beruhigungszeit in Sekunden.
+
+    Returns:
+        float: Wartezeit in Sekunden.
+    """
+    distance = max(abs(new[0] - old[0]), abs(new[1] - old[1]))
+    return distance / speed + settle
+
 
 class Camera:
     """
@@ -43,20 +83,52 @@ class Camera:
     Unterstützt auch einen Fallback-Modus mit der lokalen Webcam.
     """
 
-    def __init__(self, ip, fallback=False):
+    def __init__(self, ip, fallback=False, decode_scale=1, frame_cache=None, protocol="json"):
         """
         Erstellt ein Camera-Objekt.
 
         Args:
             ip (str): IP-Adresse der Kamera.
             fallback (bool): Fallback-Modus aktivieren (lokale Webcam).
+            decode_scale (int): Bilder verkleinert dekodieren (1, 2, 4 oder 8).
+            frame_cache (FrameCache): Optionaler Cache, gleiche Bilder werden nur einmal dekodiert.
+            protocol (str): "json" (Text-Befehle) oder "auto" (binäres Protokoll
+                aushandeln, JSON falls die Kamera es nicht kennt).
         """
+        if protocol not in ("json", "auto"):
+            raise ValueError(f"protocol muss 'json' oder 'auto' sein, nicht {protocol!r}")
         self.uri = f"ws://{ip}/ws"
         self.ws = None
         self.img_callback = None
         self.msg_callback = None
+        self.pos_callback = None
+        self.jpeg_callback = None
         self._fallback = fallback
         self.cap = None  # Für Fallback-Modus
+        self._cap_lock = threading.Lock()  # cap wird aus Worker-Threads gelesen
+
+        # Verkleinertes Dekodieren für Detektoren, Vollbild nur bei Bedarf
+        self._decode_scale = 1
+        self.set_decode_scale(decode_scale)
+        self._last_jpeg = None
+        self._last_full = None
+
+        # Inhaltsadressierter Cache (siehe tools/frame_cache.py)
+        self.frame_cache = frame_cache
+        self.last_frame_key = None
+
+        # Listener-Task, wartende Antworten und Abonnenten von frames()
+        self._listen_task = None
+        self._closing = False
+        self._connection_error = None
+        self._pending = deque()
+        self._frame_queues = set()
+
+        # Steuerprotokoll (siehe tools/protocol.py) und Positions-Stream
+        self._protocol_mode = protocol
+        self.protocol = binproto.PROTO_JSON
+        self._pos_streaming = False
+        self._pushed_pos = None
 
         # Position und Limits für Fallback
         self._x = START_POS_X
@@ -64,16 +136,28 @@ class Camera:
 
     def __del__(self):
         """
-        Destruktor: Schließt ggf. offene Verbindungen und gibt Ressourcen frei.
+        Destruktor: Gibt die Webcam frei. Eine offene WebSocket-Verbindung
+        kann hier nicht sauber geschlossen werden (kein Event-Loop), dafür
+        ``await cam.close()`` oder ``async with Camera(...)`` verwenden.
         """
-        if self.ws:
-            try:
-                asyncio.get_event_loop().run_until_complete(self.close())
-            except Exception:
-                pass
+        if self.ws is not None:
+            warnings.warn(f"Camera({self.uri}) wurde nicht geschlossen", ResourceWarning)
         if self.cap:
             self.cap.release()
 
+    async def __aenter__(self):
+        """
+        Verbindet beim Betreten von ``async with Camera(...) as cam``.
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        Schließt die Verbindung beim Verlassen des ``async with``-Blocks.
+        """
+        await self.close()
+
     def set_img_callback(self, callback):
         """
         Setzt die Callback-Funktion für empfangene Bilder.
@@ -92,18 +176,141 @@ class Camera:
         """
         self.msg_callback = callback
 
+    def set_jpeg_callback(self, callback):
+        """
+        Setzt die Callback-Funktion für die unveränderten JPEG-Bytes jedes Bildes.
+        Wird vor dem Dekodieren aufgerufen; ist nur dieser Callback gesetzt,
+        wird gar nicht dekodiert (z.B. zum Weiterleiten als MJPEG).
+
+        Args:
+            callback (function): Funktion, die bytes entgegennimmt.
+        """
+        self.jpeg_callback = callback
+
+    def set_pos_callback(self, callback):
+        """
+        Setzt die Callback-Funktion für vom Server gesendete Positionen
+        (nur mit binärem Protokoll und ``start_position_stream()``).
+
+        Args:
+            callback (function): Funktion, die ein dict mit x und y entgegennimmt.
+        """
+        self.pos_callback = callback
+
+    def set_decode_scale(self, scale):
+        """
+        Setzt den Verkleinerungsfaktor für empfangene Bilder.
+
+        JPEG-Bilder werden direkt im DCT-Bereich verkleinert dekodiert
+        (PIL ``draft()``), das spart Rechenzeit und Speicher pro Bild.
+        Das Vollbild bleibt über ``get_full_image()`` verfügbar.
+
+        Args:
+            scale (int): 1 (volle Größe), 2, 4 oder 8.
+        """
+        if scale not in DECODE_SCALES:
+            raise ValueError(f"decode_scale muss einer von {DECODE_SCALES} sein, nicht {scale!r}")
+        self._decode_scale = scale
+
+    def _decode(self, data, scale):
+        """
+        Interne Methode: Dekodiert JPEG-Bytes, bei scale > 1 verkleinert.
+        """
+        img = Image.open(io.BytesIO(data))
+        if scale > 1:
+            w, h = img.size
+            # draft() wählt die kleinste DCT-Skalierung, die mindestens diese Größe liefert
+            img.draft("RGB", (max(1, w // scale), max(1, h // scale)))
+        img.load()
+        return img
+
+    def _decode_cached(self, data, scale):
+        """
+        Interne Methode: Wie _decode(), nutzt aber den FrameCache, falls gesetzt.
+        """
+        if self.frame_cache is None:
+            return self._decode(data, scale)
+        # Dekodierte Bilder sind groß und bleiben nur im Speicher, nie auf der Festplatte
+        return self.frame_cache.get_or_compute(
+            self.last_frame_key, f"image_{scale}", lambda: self._decode(data, scale), disk=False)
+
+    def _from_cv_frame(self, frame):
+        """
+        Interne Methode: Wandelt ein OpenCV-Bild (BGR) in ein PIL.Image um
+        und verkleinert es wie eingestellt. Das Vollbild wird gemerkt.
+        """
+        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        self._last_jpeg = None
+        self.last_frame_key = None
+        self._last_full = img
+        if self._decode_scale > 1:
+            img = img.reduce(self._decode_scale)
+        return img
+
+    def get_full_image(self):
+        """
+        Liefert das zuletzt empfangene Bild in voller Auflösung.
+        Das Vollbild wird erst beim ersten Aufruf dekodiert.
+
+        Returns:
+            PIL.Image oder None: Bild in voller Auflösung.
+        """
+        if self._last_full is None and self._last_jpeg is not None:
+            self._last_full = self._decode_cached(self._last_jpeg, 1)
+        return self._last_full
+
+    def _dispatch_image(self, img):
+        """
+        Interne Methode: Gibt ein Bild an den Callback und alle frames()-Abonnenten weiter.
+        Langsame Abonnenten verpassen Bilder, statt sie zu puffern.
+        """
+        if self.img_callback:
+            self.img_callback(img, cam=self)
+        for queue in self._frame_queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(img)
+
+    def _resolve_pending(self, kind, message):
+        """
+        Interne Methode: Übergibt eine Antwort an die älteste passende Anfrage.
+
+        Returns:
+            bool: True, wenn die Nachricht eine Antwort war.
+        """
+        for entry in self._pending:
+            if entry[0] == kind and not entry[1].done():
+                self._pending.remove(entry)
+                entry[1].set_result(message)
+                return True
+        return False
+
     def _on_message(self, message):
         """
         Interne Methode: Verarbeitet eingehende Nachrichten und ruft die passenden Callbacks auf.
         """
         if isinstance(message, bytes):
-            if self.img_callback:
+            if binproto.is_control(message):
+                self._on_control(message)
+                return
+            self._resolve_pending("frame", message)
+            if self.jpeg_callback:
+                self.jpeg_callback(message, cam=self)
+            if self.img_callback or self._frame_queues:
                 try:
-                    img = Image.open(io.BytesIO(message))
-                    self.img_callback(img, cam=self)
+                    self._last_jpeg = message
+                    self._last_full = None
+                    if self.frame_cache is not None:
+                        self.last_frame_key = self.frame_cache.key(message)
+                    img = self._decode_cached(message, self._decode_scale)
+                    if self._decode_scale == 1:
+                        self._last_full = img
+                    self._dispatch_image(img)
                 except Exception as e:
                     print("Fehler beim Laden des Bildes:", e)
         else:
+            if self._resolve_pending("text", message):
+                return
             try:
                 data = json.loads(message)
                 if self.msg_callback:
@@ -112,6 +319,18 @@ class Camera:
                 if self.msg_callback:
                     self.msg_callback(message, cam=self)
 
+    def _on_control(self, message):
+        """
+        Interne Methode: Verarbeitet binäre Steuernachrichten (Antworten und Positions-Stream).
+        """
+        if message[2] == binproto.EVENT_POS:
+            self._pushed_pos = binproto.decode_reply(message)
+            if self.pos_callback:
+                self.pos_callback(dict(self._pushed_pos), cam=self)
+            return
+        if not self._resolve_pending("control", message):
+            print("Unerwartete Steuernachricht:", binproto.unpack(message))
+
     async def listen(self):
         """
         Lauscht auf neue Nachrichten/Bilder von der Kamera und ruft die Callbacks auf.
@@ -119,39 +338,138 @@ class Camera:
         """
         if self._fallback:
             # Im Fallback-Modus: periodisch Bild holen und Callback aufrufen
-            if self.cap and self.img_callback:
-                while True:
-                    ret, frame = self.cap.read()
-                    if ret:
-                        img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                        self.img_callback(img, cam=self)
+            if self.cap:
+                while not self._closing:
+                    # cap.read() blockiert, daher in einem Thread ausführen
+                    ret, frame = await asyncio.to_thread(self._read_cap)
+                    if ret and self.jpeg_callback:
+                        # Die Webcam liefert Rohbilder, JPEG nur bei Bedarf erzeugen
+                        ok, jpeg = cv2.imencode(".jpg", frame)
+                        if ok:
+                            self.jpeg_callback(jpeg.tobytes(), cam=self)
+                    if ret and (self.img_callback or self._frame_queues):
+                        self._dispatch_image(self._from_cv_frame(frame))
                     await asyncio.sleep(0.05)  # ca. 20 FPS
             else:
-                while True:
+                while not self._closing:
                     await asyncio.sleep(1)
             return
         while True:
             try:
-                msg = await self.recv()
+                msg = await self.ws.recv()
+            except Exception as e:
+                if not self._closing:
+                    print("Verbindung zur Kamera verloren:", e)
+                    self._disconnect(e)
+                return
+            try:
                 self._on_message(msg)
             except Exception as e:
-                print("Fehler beim Empfang von Nachrichten:", e)
-                print("Programm wird beendet.")
-                import sys
-                sys.exit(1)
+                print("Fehler beim Verarbeiten einer Nachricht:", e)
+
+    def _read_cap(self):
+        """
+        Interne Methode: Liest ein Bild von der Webcam (blockiert, für einen
+        Worker-Thread). Das Lock verhindert gleichzeitiges Lesen und Freigeben.
+
+        Returns:
+            tuple: (ret, frame) wie bei ``cv2.VideoCapture.read()``.
+        """
+        with self._cap_lock:
+            if self.cap is None:
+                return False, None
+            return self.cap.read()
+
+    def _release_cap(self):
+        """
+        Interne Methode: Gibt die Webcam frei, sobald kein Lesevorgang mehr läuft.
+        """
+        with self._cap_lock:
+            if self.cap is not None:
+                self.cap.release()
+                self.cap = None
+
+    def _disconnect(self, error):
+        """
+        Interne Methode: Markiert die Kamera nach einem Verbindungsabbruch als
+        geschlossen. Wartende Anfragen bekommen den Fehler, weitere Befehle
+        lösen ihn sofort aus.
+        """
+        self._closing = True
+        self._connection_error = error
+        self.ws = None
+        while self._pending:
+            future = self._pending.popleft()[1]
+            if not future.done():
+                future.set_exception(error)
+        self._end_frames()
+
+    def _end_frames(self):
+        """
+        Interne Methode: Beendet alle laufenden frames()-Iteratoren.
+        """
+        for queue in self._frame_queues:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_END_OF_FRAMES)
+
+    async def frames(self, maxsize=1):
+        """
+        Asynchroner Iterator über empfangene Bilder.
+
+        Beispiel::
+
+            async with Camera(ip) as cam:
+                async for img in cam.frames():
+                    ...
+
+        Args:
+            maxsize (int): Anzahl gepufferter Bilder. Ist der Puffer voll,
+                wird das älteste Bild verworfen.
+
+        Der Iterator endet nach ``close()``. Bricht die Verbindung ab,
+        wird der Verbindungsfehler ausgelöst.
+
+        Yields:
+            PIL.Image: Empfangene Bilder.
+        """
+        queue = asyncio.Queue(maxsize=maxsize)
+        self._frame_queues.add(queue)
+        try:
+            while True:
+                if self._connection_error is not None:
+                    raise self._connection_error
+                if self._closing:
+                    return
+                img = await queue.get()
+                if img is _END_OF_FRAMES:
+                    continue  # Abbruch oder Ende wird oben geprüft
+                yield img
+        finally:
+            self._frame_queues.discard(queue)
 
     def loop(self):
         """
         Startet eine Endlosschleife zur Kommunikation mit der Kamera (synchron).
+        Erstellt einen eigenen Event-Loop und darf daher nicht aus einem
+        laufenden Event-Loop heraus aufgerufen werden.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.connect())
+        async def run():
+            async with self:
+                await asyncio.Event().wait()
+
         try:
-            loop.run_forever()
+            asyncio.run(run())
         except KeyboardInterrupt:
             pass
-        finally:
-            loop.run_until_complete(self.close())
+
+    def _start_listener(self):
+        """
+        Interne Methode: Startet den Listener-Task (Bilder, Nachrichten, Antworten).
+        """
+        self._closing = False
+        self._connection_error = None
+        self._listen_task = asyncio.create_task(self.listen())
 
     async def connect(self):
         """
@@ -162,27 +480,102 @@ class Camera:
                 print("Fallback-Modus aktiviert, keine WebSocket-Verbindung.")
                 if cv2:
                     self.cap = cv2.VideoCapture(0)
-                asyncio.create_task(self.listen())  # Starte Fallback-Loop!
+                self._start_listener()  # Starte Fallback-Loop!
                 return
 
             print(f"Verbinde zu {self.uri}...")
             print("Versuche, WebSocket-Verbindung herzustellen...")
             self.ws = await websockets.connect(self.uri)
+
+            # Listener zuerst starten: er verteilt Antworten an wartende Anfragen,
+            # auch wenn die Kamera zwischendurch Bilder schickt.
+            self._start_listener()
+            print("Starte Listener für Nachrichten und Bilder...")
+            if self._protocol_mode == "auto":
+                await self._negotiate()
             await self.get_limits()
             await self.get_pos()
 
             print("WebSocket-Verbindung erfolgreich hergestellt.")
-
-            asyncio.create_task(self.listen())
-            print("Starte Listener für Nachrichten und Bilder...")
         except Exception as e:
             print("WebSocket-Verbindung fehlgeschlagen, Fallback-Modus wird aktiviert:", e)
+            await self._stop_listener()
+            if self.ws is not None:
+                await self.ws.close()
+                self.ws = None
             self._fallback = True
             if cv2:
                 self.cap = cv2.VideoCapture(0)
             else:
                 print("OpenCV nicht verfügbar, kein Kamerafallback möglich.")
-            asyncio.create_task(self.listen())  # Starte Fallback-Loop auch bei Fehler!
+            self._start_listener()  # Starte Fallback-Loop auch bei Fehler!
+
+    async def _negotiate(self):
+        """
+        Interne Methode: Handelt das binäre Protokoll aus. Antwortet die Kamera
+        nicht rechtzeitig oder anders als erwartet, bleibt es bei JSON.
+        """
+        try:
+            reply = await self._request(binproto.HELLO, timeout=NEGOTIATE_TIMEOUT)
+            accepted = json.loads(reply) == binproto.HELLO_REPLY
+        except (asyncio.TimeoutError, ValueError):
+            accepted = False
+        self.protocol = binproto.PROTO_BINARY if accepted else binproto.PROTO_JSON
+        print(f"Steuerprotokoll: {self.protocol}")
+
+    def is_binary(self):
+        """
+        Gibt zurück, ob das binäre Steuerprotokoll aktiv ist.
+
+        Returns:
+            bool: True, wenn binär kommuniziert wird.
+        """
+        return self.protocol == binproto.PROTO_BINARY
+
+    async def _command(self, name, a=0, b=0):
+        """
+        Interne Methode: Sendet einen Befehl ohne Antwort im ausgehandelten Protokoll.
+        """
+        if self.is_binary():
+            await self.send(binproto.pack_command(name, a, b))
+        else:
+            await self.send(name)
+
+    async def _query(self, name):
+        """
+        Interne Methode: Sendet eine Abfrage und gibt die Antwort als dict/int zurück.
+        """
+        if self.is_binary():
+            reply = await self._request(binproto.pack_command(name), kind="control")
+            return binproto.decode_reply(reply)
+        msg = await self._request(name)
+        return json.loads(msg)
+
+    async def start_position_stream(self):
+        """
+        Bittet die Kamera, jede Positionsänderung ungefragt zu senden.
+        ``get_pos()`` liefert dann die zuletzt gesendete Position ohne Abfrage.
+        Nur mit binärem Protokoll verfügbar.
+
+        Returns:
+            bool: True, wenn der Stream aktiv ist.
+        """
+        if self._fallback or not self.is_binary():
+            print("Positions-Stream nur mit binärem Protokoll verfügbar.")
+            return False
+        await self.send(binproto.pack_command("pos_stream", 1))
+        self._pos_streaming = True
+        return True
+
+    async def stop_position_stream(self):
+        """
+        Beendet den Positions-Stream, ``get_pos()`` fragt wieder bei der Kamera nach.
+        """
+        if not self._pos_streaming:
+            return
+        self._pos_streaming = False
+        self._pushed_pos = None
+        await self.send(binproto.pack_command("pos_stream", 0))
 
     async def send(self, msg):
         """
@@ -194,6 +587,10 @@ class Camera:
         if self._fallback:
             print(f"[Fallback] send: {msg}")
             return
+        if self._connection_error is not None:
+            raise self._connection_error
+        if self.ws is None:
+            raise RuntimeError("Kamera nicht verbunden")
         if isinstance(msg, dict):
             await self.ws.send(json.dumps(msg))
         else:
@@ -201,7 +598,8 @@ class Camera:
 
     async def recv(self):
         """
-        Empfängt eine Nachricht von der Kamera.
+        Empfängt die nächste Textnachricht von der Kamera.
+        Läuft der Listener, wird die Nachricht über ihn zugestellt.
 
         Returns:
             str: Empfangene Nachricht.
@@ -209,7 +607,46 @@ class Camera:
         if self._fallback:
             print("[Fallback] recv aufgerufen")
             return None
-        return await self.ws.recv()
+        if self._listen_task is None or self._listen_task.done():
+            if self.ws is None:
+                raise RuntimeError("Kamera nicht verbunden")
+            return await self.ws.recv()
+        return await self._wait_reply(self._expect_reply("text"))
+
+    def _expect_reply(self, kind):
+        """
+        Interne Methode: Registriert eine Anfrage, die auf eine Antwort der Art
+        kind ("text" oder "frame") wartet.
+        """
+        entry = (kind, asyncio.get_running_loop().create_future())
+        self._pending.append(entry)
+        return entry
+
+    async def _wait_reply(self, entry, timeout=REPLY_TIMEOUT):
+        """
+        Interne Methode: Wartet auf die Antwort zu einer registrierten Anfrage.
+        """
+        try:
+            return await asyncio.wait_for(entry[1], timeout)
+        finally:
+            if entry in self._pending:
+                self._pending.remove(entry)
+
+    async def _request(self, msg, kind="text", timeout=REPLY_TIMEOUT):
+        """
+        Interne Methode: Sendet einen Befehl und wartet auf die zugehörige Antwort.
+        Die Anfrage wird vor dem Senden registriert, damit keine Antwort verloren geht.
+        """
+        if self._listen_task is None or self._listen_task.done():
+            await self.send(msg)
+            return await asyncio.wait_for(self.ws.recv(), timeout)
+        entry = self._expect_reply(kind)
+        try:
+            await self.send(msg)
+        except BaseException:
+            self._pending.remove(entry)
+            raise
+        return await self._wait_reply(entry, timeout)
 
     async def getframe(self):
         """
@@ -219,16 +656,16 @@ class Camera:
             PIL.Image oder bytes: Bilddaten.
         """
         if self._fallback and self.cap:
-            ret, frame = self.cap.read()
+            ret, frame = await asyncio.to_thread(self._read_cap)
             if ret:
                 img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
                 return img
             else:
                 print("[Fallback] Kein Bild von interner Kamera erhalten.")
                 return None
-        await self.send("getframe")
-        data = await self.recv()
-        return data
+        if self.is_binary():
+            return await self._request(binproto.pack_command("getframe"), kind="frame")
+        return await self._request("getframe", kind="frame")
 
     async def center(self):
         """
@@ -240,7 +677,7 @@ class Camera:
             print(f"[Fallback] center: x={self._x}, y={self._y}")
             return
         print("Zentrierungsbefehl gesendet.")
-        await self.send("center")
+        await self._command("center")
 
     async def up(self):
         """
@@ -252,7 +689,7 @@ class Camera:
             print(f"[Fallback] up: x={self._x}, y={self._y}")
             return
         print("Aufwärtsbefehl gesendet.")
-        await self.send("up")
+        await self._command("up")
 
     async def down(self):
         """
@@ -264,7 +701,7 @@ class Camera:
             print(f"[Fallback] down: x={self._x}, y={self._y}")
             return
         print("Abwärtsbefehl gesendet.")
-        await self.send("down")
+        await self._command("down")
 
     async def left(self):
         """
@@ -276,7 +713,7 @@ class Camera:
             print(f"[Fallback] left: x={self._x}, y={self._y}")
             return
         print("Linksbefehl gesendet.")
-        await self.send("left")
+        await self._command("left")
 
     async def right(self):
         """
@@ -288,7 +725,7 @@ class Camera:
             print(f"[Fallback] right: x={self._x}, y={self._y}")
             return
         print("Rechtsbefehl gesendet.")
-        await self.send("right")
+        await self._command("right")
 
     async def get_pos(self):
         """
@@ -300,9 +737,9 @@ class Camera:
         if self._fallback:
             print(f"[Fallback] get_pos: x={self._x}, y={self._y}")
             return {"x": self._x, "y": self._y}
-        await self.send("get_pos")
-        msg = await self.recv()
-        return json.loads(msg)
+        if self._pos_streaming and self._pushed_pos is not None:
+            return dict(self._pushed_pos)
+        return await self._query("get_pos")
 
     async def client_count(self):
         """
@@ -314,9 +751,7 @@ class Camera:
         if self._fallback:
             print("[Fallback] client_count")
             return 1
-        await self.send("client_count")
-        msg = await self.recv()
-        return json.loads(msg)
+        return await self._query("client_count")
 
     async def get_limits(self):
         """
@@ -331,9 +766,7 @@ class Camera:
                 "x_min": MIN_POS_X, "x_max": MAX_POS_X,
                 "y_min": MIN_POS_Y, "y_max": MAX_POS_Y
             }
-        await self.send("get_limits")
-        msg = await self.recv()
-        return json.loads(msg)
+        return await self._query("get_limits")
 
     async def light_on(self):
         """
@@ -342,7 +775,7 @@ class Camera:
         if self._fallback:
             print("[Fallback] light_on")
             return
-        await self.send("light_on")
+        await self._command("light_on")
 
     async def light_off(self):
         """
@@ -351,7 +784,7 @@ class Camera:
         if self._fallback:
             print("[Fallback] light_off")
             return
-        await self.send("light_off")
+        await self._command("light_off")
 
     async def set_position(self, x, y):
         """
@@ -367,7 +800,13 @@ class Camera:
             self._y = min(MAX_POS_Y, max(MIN_POS_Y, y))
             print(f"[Fallback] set_position: x={self._x}, y={self._y}")
             return
-        await self.send({"x": x, "y": y})
+        if self.is_binary():
+            # Das Binärformat kennt nur ganze Grad (int16)
+            x = min(MAX_POS_X, max(MIN_POS_X, int(round(x))))
+            y = min(MAX_POS_Y, max(MIN_POS_Y, int(round(y))))
+            await self.send(binproto.pack_command("set_position", x, y))
+        else:
+            await self.send({"x": x, "y": y})
         print("Positionsbefehl gesendet.")
 
     async def close(self):
@@ -375,15 +814,38 @@ class Camera:
         Schließt die Verbindung zur Kamera und gibt Ressourcen frei.
         """
         print("Schließe Kamera-Verbindung...")
+        await self._stop_listener()
+        self.protocol = binproto.PROTO_JSON
+        self._pos_streaming = False
+        self._pushed_pos = None
         if self._fallback:
             if self.cap:
                 print("[Fallback] Webcam wird freigegeben.")
-                self.cap.release()
+                # Wartet in einem Thread, bis ein laufendes read() fertig ist
+                await asyncio.to_thread(self._release_cap)
             print("[Fallback] Verbindung geschlossen.")
             return
-        await self.ws.close()
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
         print("WebSocket-Verbindung geschlossen.")
 
+    async def _stop_listener(self):
+        """
+        Interne Methode: Beendet den Listener-Task und bricht offene Anfragen ab.
+        """
+        self._closing = True
+        task, self._listen_task = self._listen_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+        self._end_frames()
+
     def is_fallback(self):
         """
         Gibt zurück, ob der Fallback-Modus aktiv ist.
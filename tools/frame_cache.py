@@ -0,0 +1,263 @@
+"""
++---------------------------------------------------------------+
+|             Bild-Cache für das SUSCam-Projekt                 |
+|---------------------------------------------------------------|
+| Speichert Ergebnisse pro Bildinhalt: Der Schlüssel ist ein    |
+| schneller Hash der JPEG-Bytes. Kommt dasselbe Bild noch       |
+| einmal (Replay, Benchmark, unbewegte Szene), werden           |
+| Dekodieren und Erkennung übersprungen.                        |
+|                                                               |
+| - LRU-Cache im Speicher, begrenzt nach Anzahl und Größe       |
+| - Optional zusätzlich auf der Festplatte (Pickle-Dateien),    |
+|   mit Größenlimit; älteste Dateien werden gelöscht            |
+| - Trefferquoten über stats() abfragen                         |
++---------------------------------------------------------------+
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def _sizeof(value):
+    """
+    Schätzt den Speicherbedarf eines Eintrags in Bytes. Bilder und Arrays
+    werden nach ihren Pixeldaten gezählt, alles andere mit sys.getsizeof().
+    """
+    if Image is not None and isinstance(value, Image.Image):
+        return value.width * value.height * len(value.getbands())
+    if np is not None and isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class FrameCache:
+    """
+    Inhaltsadressierter Cache für dekodierte Bilder und Detektor-Ergebnisse.
+
+    Jeder Eintrag wird über (Schlüssel, Art) gefunden, z.B.
+    (``FrameCache.key(jpeg)``, ``"faces"``). Gespeicherte Objekte werden
+    geteilt und sollten daher nicht verändert werden.
+
+    Große Einträge wie dekodierte Bilder sollten mit ``disk=False`` nur im
+    Speicher gehalten werden; auf die Festplatte gehören kleine Ergebnisse
+    wie erkannte Gesichter.
+    """
+
+    def __init__(self, max_items=256, max_bytes=64 * 1024 * 1024, disk_dir=None,
+                 max_disk_bytes=256 * 1024 * 1024):
+        """
+        Erstellt einen FrameCache.
+
+        Args:
+            max_items (int): Maximale Anzahl Einträge im Speicher.
+            max_bytes (int): Maximale (geschätzte) Größe des Speicher-Caches in Bytes.
+            disk_dir (str): Verzeichnis für den Festplatten-Cache (None = aus).
+            max_disk_bytes (int): Maximale Größe des Festplatten-Caches in Bytes.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._files = OrderedDict()   # Pfad -> Größe, älteste zuerst
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._scan_disk()
+        self._items = OrderedDict()   # (Schlüssel, Art) -> (Wert, Größe)
+        self._memory_bytes = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(data):
+        """
+        Berechnet den Schlüssel für einen Bildinhalt.
+
+        Args:
+            data (bytes): Rohdaten des Bildes (z.B. JPEG).
+
+        Returns:
+            str: 32-stelliger Hex-Hash (BLAKE2b, 128 Bit).
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _scan_disk(self):
+        """
+        Interne Methode: Liest vorhandene Cache-Dateien ein (älteste zuerst) und
+        hält das Größenlimit ein.
+        """
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.is_file() and entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(entries):
+            self._files[path] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """
+        Interne Methode: Löscht die ältesten Dateien, bis das Größenlimit eingehalten ist.
+        """
+        while self._files and self._disk_bytes > self.max_disk_bytes:
+            path, size = self._files.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key, kind):
+        """
+        Interne Methode: Dateipfad eines Eintrags im Festplatten-Cache.
+        """
+        safe_kind = "".join(c if c.isalnum() else "_" for c in kind)
+        return os.path.join(self.disk_dir, f"{key}-{safe_kind}.pkl")
+
+    def _remember(self, entry, value):
+        """
+        Interne Methode: Legt einen Eintrag im Speicher ab und verdrängt die ältesten,
+        bis Anzahl und Größe eingehalten sind.
+        """
+        size = _sizeof(value)
+        old = self._items.pop(entry, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        self._items[entry] = (value, size)
+        self._memory_bytes += size
+        while self._items and (len(self._items) > self.max_items or self._memory_bytes > self.max_bytes):
+            _, (_, size) = self._items.popitem(last=False)
+            self._memory_bytes -= size
+
+    def get(self, key, kind, default=None, disk=True):
+        """
+        Sucht einen Eintrag erst im Speicher, dann auf der Festplatte.
+
+        Args:
+            key (str): Schlüssel aus ``FrameCache.key()``.
+            kind (str): Art des Eintrags, z.B. "image" oder "faces".
+            default: Rückgabewert, wenn nichts gefunden wurde.
+            disk (bool): Auch im Festplatten-Cache suchen.
+
+        Returns:
+            Gespeicherter Wert oder default.
+        """
+        entry = (key, kind)
+        if entry in self._items:
+            self._items.move_to_end(entry)
+            self._memory_hits += 1
+            return self._items[entry][0]
+        path = self._path(key, kind) if self.disk_dir and disk else None
+        if path in self._files:
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except Exception as e:
+                print("Fehler beim Lesen aus dem Festplatten-Cache:", e)
+            else:
+                self._files.move_to_end(path)  # zuletzt benutzt
+                self._disk_hits += 1
+                self._remember(entry, value)
+                return value
+        self._misses += 1
+        return default
+
+    def put(self, key, kind, value, disk=True):
+        """
+        Speichert einen Eintrag im Speicher und ggf. auf der Festplatte.
+
+        Args:
+            key (str): Schlüssel aus ``FrameCache.key()``.
+            kind (str): Art des Eintrags.
+            value: Zu speichernder Wert (für die Festplatte: mit pickle speicherbar).
+            disk (bool): Auch im Festplatten-Cache speichern.
+        """
+        self._remember((key, kind), value)
+        if self.disk_dir and disk:
+            path = self._path(key, kind)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)  # atomar, keine halb geschriebenen Dateien
+                size = os.path.getsize(path)
+                self._disk_bytes += size - self._files.pop(path, 0)
+                self._files[path] = size
+                self._evict_disk()
+            except Exception as e:
+                print("Fehler beim Schreiben in den Festplatten-Cache:", e)
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    def get_or_compute(self, key, kind, compute, disk=True):
+        """
+        Liefert einen Eintrag aus dem Cache oder berechnet und speichert ihn.
+
+        Args:
+            key (str): Schlüssel aus ``FrameCache.key()``.
+            kind (str): Art des Eintrags.
+            compute (function): Funktion ohne Argumente, die den Wert berechnet.
+            disk (bool): Festplatten-Cache verwenden.
+
+        Returns:
+            Gespeicherter oder neu berechneter Wert.
+        """
+        missing = object()
+        value = self.get(key, kind, missing, disk=disk)
+        if value is missing:
+            value = compute()
+            self.put(key, kind, value, disk=disk)
+        return value
+
+    def clear(self, disk=False):
+        """
+        Leert den Speicher-Cache.
+
+        Args:
+            disk (bool): Auch alle Dateien im Festplatten-Cache löschen.
+        """
+        self._items.clear()
+        self._memory_bytes = 0
+        if disk:
+            for path in self._files:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._files.clear()
+            self._disk_bytes = 0
+
+    def stats(self):
+        """
+        Gibt die Trefferstatistik zurück.
+
+        Returns:
+            dict: Treffer im Speicher/auf der Festplatte, Fehlschläge,
+                Trefferquote (0..1), Anzahl und Größe der Einträge im
+                Speicher sowie Größe des Festplatten-Caches in Bytes.
+        """
+        lookups = self._memory_hits + self._disk_hits + self._misses
+        return {
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": (self._memory_hits + self._disk_hits) / lookups if lookups else 0.0,
+            "items": len(self._items),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes,
+        }
@@ -0,0 +1,299 @@
+"""
++---------------------------------------------------------------+
+|            Gestensteuerung für das SUSCam-Projekt             |
+|---------------------------------------------------------------|
+| Wandelt MediaPipe-Hand-Landmarks in Kamerabefehle um:         |
+| „Hand zeigen = Kamera schwenkt“.                              |
+|                                                               |
+| - Offene Hand:   Kamera folgt der Hand                        |
+| - Faust:         Pause, Kamera bleibt stehen                  |
+| - Zeigefinger:   Kamera zentrieren                            |
+|                                                               |
+| Gesten werden entprellt (mehrere Bilder in Folge nötig),      |
+| doppelte Befehle werden unterdrückt und die Zeit vom Bild     |
+| bis zum gesendeten Motorbefehl wird gemessen.                 |
++---------------------------------------------------------------+
+"""
+
+import asyncio
+import time
+from collections import deque
+
+import numpy as np
+
+from tools.cam import START_POS_X, MIN_POS_X, MAX_POS_X, START_POS_Y, MIN_POS_Y, MAX_POS_Y
+from tools.cam import DEFAULT_SPEED, DEFAULT_SETTLE, settle_time
+
+# Landmark-Indizes der MediaPipe-Handerkennung (21 Punkte pro Hand)
+WRIST = 0
+FINGER_TIPS = np.array([8, 12, 16, 20])   # Zeige-, Mittel-, Ring-, kleiner Finger
+FINGER_PIPS = np.array([6, 10, 14, 18])   # jeweils das mittlere Fingergelenk
+PALM = np.array([0, 5, 9, 13, 17])        # Handgelenk und Fingeransätze
+
+# Ein Finger gilt als gestreckt, wenn die Spitze deutlich weiter vom
+# Handgelenk entfernt ist als das mittlere Gelenk
+EXTEND_RATIO = 1.1
+
+# Anzahl der letzten Befehle, über die latency_stats() rechnet
+LATENCY_HISTORY = 500
+
+# Gesten
+GESTURE_NONE = "none"
+GESTURE_OPEN = "open"
+GESTURE_FIST = "fist"
+GESTURE_POINT = "point"
+
+# Zustände der Steuerung
+STATE_IDLE = "idle"
+STATE_TRACKING = "tracking"
+STATE_PAUSED = "paused"
+STATE_CENTERED = "centered"
+
+
+def landmarks_to_array(multi_hand_landmarks):
+    """
+    Wandelt ``results.multi_hand_landmarks`` von MediaPipe in ein NumPy-Array um.
+
+    Args:
+        multi_hand_landmarks: Liste der erkannten Hände oder None.
+
+    Returns:
+        np.ndarray: Form (Hände, 21, 3) mit normierten x, y, z-Koordinaten.
+    """
+    if not multi_hand_landmarks:
+        return np.empty((0, 21, 3), dtype=np.float32)
+    return np.array(
+        [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in multi_hand_landmarks],
+        dtype=np.float32,
+    )
+
+
+def select_hand(hands):
+    """
+    Wählt die größte Hand (Fläche des Landmark-Rechtecks). Die Reihenfolge
+    der Hände bei MediaPipe wechselt zwischen Bildern, die größte Hand ist
+    meist die, die der Kamera am nächsten ist.
+
+    Args:
+        hands (np.ndarray): Landmarks der Form (Hände, 21, 3).
+
+    Returns:
+        int: Index der gewählten Hand.
+    """
+    xy = hands[:, :, :2]
+    extent = xy.max(axis=1) - xy.min(axis=1)
+    return int(np.argmax(extent[:, 0] * extent[:, 1]))
+
+
+def classify_hands(hands):
+    """
+    Erkennt die Geste und den Handmittelpunkt für alle Hände auf einmal.
+
+    Args:
+        hands (np.ndarray): Landmarks der Form (Hände, 21, 3).
+
+    Returns:
+        tuple: (Gesten als np.ndarray von Strings, Mittelpunkte der Form (Hände, 2)).
+    """
+    xy = hands[:, :, :2]
+    wrist = xy[:, WRIST:WRIST + 1, :]
+    tip_dist = np.linalg.norm(xy[:, FINGER_TIPS, :] - wrist, axis=-1)
+    pip_dist = np.linalg.norm(xy[:, FINGER_PIPS, :] - wrist, axis=-1)
+    extended = tip_dist > pip_dist * EXTEND_RATIO
+    count = extended.sum(axis=1)
+
+    gestures = np.full(len(hands), GESTURE_NONE, dtype=object)
+    gestures[count >= 4] = GESTURE_OPEN
+    gestures[count == 0] = GESTURE_FIST
+    gestures[(count == 1) & extended[:, 0]] = GESTURE_POINT
+    centers = xy[:, PALM, :].mean(axis=1)
+    return gestures, centers
+
+
+class GestureController:
+    """
+    Entprellter Zustandsautomat, der Handgesten in Kamerabewegungen umsetzt.
+
+    Pro Bild wird ``process()`` mit den Landmarks aufgerufen. Eine Geste
+    wirkt erst, wenn sie ``hold_frames`` Bilder in Folge erkannt wurde.
+    Es ist höchstens ein Befehl gleichzeitig unterwegs, und eine Position
+    wird nicht zweimal hintereinander gesendet.
+
+    Nach einem Befehl werden Bilder ignoriert, bis die Kamera die Bewegung
+    laut Schätzung (Strecke / Geschwindigkeit + Beruhigungszeit) beendet
+    hat. Ältere Bilder zeigen die Hand noch an der alten Stelle und würden
+    sonst zu Überschwingern führen.
+    """
+
+    def __init__(self, cam, hold_frames=3, deadzone=0.08, gain=(30.0, 20.0),
+                 min_interval=0.1, invert_x=False, invert_y=False,
+                 speed=DEFAULT_SPEED, settle=DEFAULT_SETTLE):
+        """
+        Erstellt einen GestureController.
+
+        Args:
+            cam (Camera): Kamera, die gesteuert wird.
+            hold_frames (int): Bilder in Folge, bis eine Geste gilt.
+            deadzone (float): Abstand zur Bildmitte (0..0.5), in dem nicht bewegt wird.
+            gain (tuple): Grad pro Bildbreite/-höhe Abstand zur Mitte (x, y).
+            min_interval (float): Mindestabstand zwischen zwei Befehlen in Sekunden.
+            invert_x (bool): Schwenkrichtung umkehren (z.B. bei gespiegeltem Bild).
+            invert_y (bool): Neigerichtung umkehren.
+            speed (float): Servo-Geschwindigkeit in Grad pro Sekunde.
+            settle (float): Beruhigungszeit nach jeder Bewegung in Sekunden.
+        """
+        self.cam = cam
+        self.hold_frames = hold_frames
+        self.deadzone = deadzone
+        self.gain = np.array(gain, dtype=np.float32) * np.array(
+            [-1.0 if invert_x else 1.0, -1.0 if invert_y else 1.0], dtype=np.float32)
+        self.min_interval = min_interval
+        self.speed = speed
+        self.settle = settle
+
+        self.state = STATE_IDLE
+        self.limits = (MIN_POS_X, MAX_POS_X, MIN_POS_Y, MAX_POS_Y)
+        self.x = START_POS_X
+        self.y = START_POS_Y
+
+        self._candidate = GESTURE_NONE
+        self._candidate_frames = 0
+        self._last_command = None
+        self._last_sent = 0.0
+        self._moving_until = 0.0
+        self._task = None
+        self._latencies = deque(maxlen=LATENCY_HISTORY)
+
+    async def sync_position(self):
+        """
+        Übernimmt aktuelle Position und Grenzen von der Kamera.
+        """
+        limits = await self.cam.get_limits()
+        self.limits = (limits["x_min"], limits["x_max"], limits["y_min"], limits["y_max"])
+        pos = await self.cam.get_pos()
+        self.x, self.y = pos["x"], pos["y"]
+
+    def _debounce(self, gesture):
+        """
+        Interne Methode: Liefert die Geste erst, wenn sie lange genug stabil ist.
+        """
+        if gesture == self._candidate:
+            self._candidate_frames += 1
+        else:
+            self._candidate = gesture
+            self._candidate_frames = 1
+        if self._candidate_frames >= self.hold_frames:
+            return self._candidate
+        return None
+
+    def update(self, hands, now=None):
+        """
+        Berechnet aus den Landmarks eines Bildes den nächsten Befehl.
+
+        Args:
+            hands (np.ndarray): Landmarks der Form (Hände, 21, 3).
+            now (float): Aufnahmezeitpunkt des Bildes (time.perf_counter()), Standard: jetzt.
+
+        Returns:
+            tuple oder None: ("center",) oder ("set_position", x, y).
+        """
+        now = time.perf_counter() if now is None else now
+        if len(hands):
+            gestures, centers = classify_hands(hands)
+            index = select_hand(hands)
+            gesture, center = gestures[index], centers[index]
+        else:
+            gesture, center = GESTURE_NONE, None
+
+        stable = self._debounce(gesture)
+        if stable is None:
+            return None
+
+        if stable == GESTURE_FIST:
+            self.state = STATE_PAUSED
+            return None
+        if stable == GESTURE_NONE:
+            self.state = STATE_IDLE
+            return None
+        if stable == GESTURE_POINT:
+            if self.state == STATE_CENTERED:
+                return None
+            return self._emit(("center",), now, STATE_CENTERED)
+        if stable != GESTURE_OPEN:
+            return None
+
+        self.state = STATE_TRACKING
+        offset = center - 0.5
+        if np.all(np.abs(offset) < self.deadzone):
+            return None
+        x_min, x_max, y_min, y_max = self.limits
+        dx, dy = np.rint(offset * self.gain).astype(int)
+        x = int(np.clip(self.x + dx, x_min, x_max))
+        y = int(np.clip(self.y + dy, y_min, y_max))
+        return self._emit(("set_position", x, y), now, STATE_TRACKING)
+
+    def _emit(self, command, now, state):
+        """
+        Interne Methode: Gibt einen Befehl frei, wenn er neu ist und nichts mehr unterwegs ist.
+        """
+        if command == self._last_command:
+            return None
+        if self._task is not None and not self._task.done():
+            return None
+        if now - self._last_sent < self.min_interval:
+            return None
+        if now < self._moving_until:
+            return None  # Bild entstand, während die Kamera noch fuhr
+        self.state = state
+        self._last_command = command
+        self._last_sent = now
+        target = (START_POS_X, START_POS_Y) if command[0] == "center" else (command[1], command[2])
+        self._moving_until = now + settle_time((self.x, self.y), target, self.speed, self.settle)
+        self.x, self.y = target
+        return command
+
+    def process(self, hands, t_frame=None):
+        """
+        Wertet die Landmarks eines Bildes aus und sendet ggf. den Befehl an die Kamera.
+        Muss innerhalb des Event-Loops aufgerufen werden (z.B. im Bild-Callback).
+
+        Args:
+            hands (np.ndarray): Landmarks der Form (Hände, 21, 3).
+            t_frame (float): Zeitpunkt (time.perf_counter()), an dem das Bild ankam.
+
+        Returns:
+            tuple oder None: Der gesendete Befehl.
+        """
+        t_frame = time.perf_counter() if t_frame is None else t_frame
+        command = self.update(hands, t_frame)
+        if command is not None:
+            self._task = asyncio.get_running_loop().create_task(self._send(command, t_frame))
+        return command
+
+    async def _send(self, command, t_frame):
+        """
+        Interne Methode: Sendet einen Befehl und misst die Zeit seit Bildeingang.
+        """
+        if command[0] == "center":
+            await self.cam.center()
+        else:
+            await self.cam.set_position(command[1], command[2])
+        self._latencies.append(time.perf_counter() - t_frame)
+
+    def latency_stats(self):
+        """
+        Gibt die gemessene Latenz vom Bildeingang bis zum gesendeten Befehl zurück
+        (über die letzten ``LATENCY_HISTORY`` Befehle).
+
+        Returns:
+            dict: Anzahl, Mittelwert, 95%-Perzentil und Maximum in Millisekunden.
+        """
+        if not self._latencies:
+            return {"count": 0, "mean_ms": None, "p95_ms": None, "max_ms": None}
+        ms = np.array(self._latencies) * 1000.0
+        return {
+            "count": len(ms),
+            "mean_ms": float(ms.mean()),
+            "p95_ms": float(np.percentile(ms, 95)),
+            "max_ms": float(ms.max()),
+        }
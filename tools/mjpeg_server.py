@@ -0,0 +1,226 @@
+"""
++---------------------------------------------------------------+
+|          MJPEG-Server (HTTP) für das SUSCam-Projekt           |
+|---------------------------------------------------------------|
+| Stellt den Kamerastream im Browser bereit – ohne OpenCV-      |
+| Fenster und auch auf anderen Geräten im Netz.                 |
+|                                                               |
+| - /stream.mjpg     Kamerabilder unverändert (kein Dekodieren) |
+| - /annotated.mjpg  Bearbeitete Bilder, werden nur kodiert,    |
+|                    solange jemand zuschaut                    |
+| - /snapshot.jpg    Einzelbild                                 |
+| - /                Einfache Übersichtsseite                   |
+|                                                               |
+| Jeder Browser bekommt immer nur das neueste Bild: Langsame    |
+| Verbindungen verpassen Bilder, statt sie zu puffern.          |
++---------------------------------------------------------------+
+"""
+
+import asyncio
+import io
+
+import numpy as np
+from PIL import Image
+
+BOUNDARY = b"frame"
+
+INDEX_HTML = b"""<!doctype html>
+<html><head><meta charset="utf-8"><title>SUSCam</title></head>
+<body style="background:#111;color:#eee;font-family:sans-serif">
+<h1>SUSCam</h1>
+<p><a href="/stream.mjpg">Kamera</a> | <a href="/annotated.mjpg">Bearbeitet</a> | <a href="/snapshot.jpg">Einzelbild</a></p>
+<img src="/stream.mjpg" style="max-width:100%">
+</body></html>
+"""
+
+
+class _LatestFrame:
+    """
+    Interne Klasse: Hält für einen Client nur das jeweils neueste Bild.
+    """
+
+    def __init__(self):
+        self.data = None
+        self._event = asyncio.Event()
+
+    def put(self, data):
+        """
+        Legt ein neues Bild ab; None beendet den Stream des Clients.
+        """
+        self.data = data
+        self._event.set()
+
+    async def get(self):
+        await self._event.wait()
+        self._event.clear()
+        return self.data
+
+
+class MjpegServer:
+    """
+    Kleiner asyncio-HTTP-Server, der die Bilder einer Camera als MJPEG
+    (multipart/x-mixed-replace) an beliebig viele Browser verteilt.
+    """
+
+    def __init__(self, cam, host="0.0.0.0", port=8080, annotate=None, quality=80):
+        """
+        Erstellt einen MjpegServer.
+
+        Args:
+            cam (Camera): Verbundene Kamera.
+            host (str): Adresse, auf der der Server lauscht.
+            port (int): HTTP-Port.
+            annotate (function): Bekommt ein PIL.Image und gibt das bearbeitete Bild
+                (PIL.Image oder RGB-Array) zurück. None = kein /annotated.mjpg.
+            quality (int): JPEG-Qualität der bearbeiteten Bilder.
+        """
+        self.cam = cam
+        self.host = host
+        self.port = port
+        self.annotate = annotate
+        self.quality = quality
+        self._latest = None
+        self._raw_clients = set()
+        self._annotated_clients = set()
+        self._annotate_task = None
+        self._server = None
+
+    def _on_jpeg(self, data, cam):
+        """
+        Interne Methode: Verteilt die unveränderten JPEG-Bytes an alle Clients.
+        """
+        self._latest = data
+        for client in self._raw_clients:
+            client.put(data)
+
+    async def start(self):
+        """
+        Startet den HTTP-Server.
+        """
+        self.cam.set_jpeg_callback(self._on_jpeg)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        print(f"MJPEG-Server läuft auf http://{self.host}:{self.port}/")
+
+    async def serve_forever(self):
+        """
+        Startet den Server (falls nötig) und läuft, bis der Task abgebrochen wird.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Beendet den Server und die Bearbeitung.
+        """
+        self.cam.set_jpeg_callback(None)
+        if self._annotate_task is not None:
+            self._annotate_task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _encode_annotated(self, img):
+        """
+        Interne Methode: Bearbeitet ein Bild und kodiert es als JPEG (läuft in einem Thread).
+        """
+        out = self.annotate(img)
+        if isinstance(out, np.ndarray):
+            out = Image.fromarray(out)
+        buf = io.BytesIO()
+        out.convert("RGB").save(buf, format="JPEG", quality=self.quality)
+        return buf.getvalue()
+
+    async def _annotate_loop(self):
+        """
+        Interne Methode: Dekodiert, bearbeitet und kodiert Bilder, solange
+        mindestens ein Client /annotated.mjpg ansieht.
+
+        Fehler in ``annotate`` werden pro Bild ausgegeben und das Bild
+        übersprungen. Endet die Schleife (Kamera geschlossen oder getrennt),
+        werden die Streams aller Clients beendet, damit kein Browser hängt.
+        """
+        try:
+            async for img in self.cam.frames():
+                if not self._annotated_clients:
+                    break
+                try:
+                    data = await asyncio.to_thread(self._encode_annotated, img)
+                except Exception as e:
+                    print("Fehler beim Bearbeiten des Bildes:", e)
+                    continue
+                for client in self._annotated_clients:
+                    client.put(data)
+        except Exception as e:
+            print("Bearbeitete Bilder nicht mehr verfügbar:", e)
+        finally:
+            for client in self._annotated_clients:
+                client.put(None)
+
+    async def _stream(self, writer, clients):
+        """
+        Interne Methode: Sendet einem Client fortlaufend das jeweils neueste Bild.
+        """
+        client = _LatestFrame()
+        clients.add(client)
+        if clients is self._annotated_clients and (self._annotate_task is None or self._annotate_task.done()):
+            self._annotate_task = asyncio.create_task(self._annotate_loop())
+        elif clients is self._raw_clients and self._latest is not None:
+            client.put(self._latest)  # sofort etwas anzeigen
+        try:
+            writer.write(b"HTTP/1.0 200 OK\r\n"
+                         b"Content-Type: multipart/x-mixed-replace; boundary=" + BOUNDARY + b"\r\n"
+                         b"Cache-Control: no-cache, no-store\r\n"
+                         b"Connection: close\r\n\r\n")
+            while True:
+                data = await client.get()
+                if data is None:
+                    break  # Bildquelle beendet
+                writer.writelines([
+                    b"--" + BOUNDARY + b"\r\nContent-Type: image/jpeg\r\n",
+                    f"Content-Length: {len(data)}\r\n\r\n".encode(),
+                    data,
+                    b"\r\n",
+                ])
+                # Wartet, bis der Client die Daten abgenommen hat; neue Bilder
+                # überschreiben währenddessen nur den Platz in _LatestFrame
+                await writer.drain()
+        finally:
+            clients.discard(client)
+
+    async def _respond(self, writer, status, content_type, body):
+        """
+        Interne Methode: Sendet eine einfache HTTP-Antwort.
+        """
+        writer.write(f"HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode())
+        writer.write(body)
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        """
+        Interne Methode: Bearbeitet eine HTTP-Anfrage.
+        """
+        try:
+            request = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # Header werden nicht gebraucht
+            parts = request.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) >= 2 else ""
+
+            if path == "/stream.mjpg":
+                await self._stream(writer, self._raw_clients)
+            elif path == "/annotated.mjpg" and self.annotate is not None:
+                await self._stream(writer, self._annotated_clients)
+            elif path == "/snapshot.jpg" and self._latest is not None:
+                await self._respond(writer, "200 OK", "image/jpeg", self._latest)
+            elif path == "/":
+                await self._respond(writer, "200 OK", "text/html; charset=utf-8", INDEX_HTML)
+            else:
+                await self._respond(writer, "404 Not Found", "text/plain", b"Nicht gefunden\n")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Browser hat die Verbindung geschlossen
+        finally:
+            writer.close()
@@ -0,0 +1,113 @@
+"""
++---------------------------------------------------------------+
+|          Binäres Steuerprotokoll für das SUSCam-Projekt       |
+|---------------------------------------------------------------|
+| Kompakte Alternative zu Text-Befehlen und JSON-Antworten.     |
+| Jede Nachricht ist genau 11 Bytes lang:                       |
+|                                                               |
+|   "SC" | Typ (uint8) | a | b | c | d  (je int16, little end.) |
+|                                                               |
+| Das Protokoll wird beim Verbinden mit "proto bin1"            |
+| ausgehandelt. Antwortet die Kamera nicht mit                  |
+| {"proto": "bin1"}, bleibt es bei Text/JSON.                   |
+|                                                               |
+| JPEG-Bilder beginnen mit 0xFF 0xD8 und sind daher nie mit     |
+| Steuernachrichten zu verwechseln.                             |
++---------------------------------------------------------------+
+"""
+
+import struct
+
+PROTO_JSON = "json"
+PROTO_BINARY = "bin1"
+
+# Text-Befehl zum Aushandeln und erwartete Antwort
+HELLO = f"proto {PROTO_BINARY}"
+HELLO_REPLY = {"proto": PROTO_BINARY}
+
+MAGIC = b"SC"
+MESSAGE = struct.Struct("<2sBhhhh")
+MESSAGE_SIZE = MESSAGE.size  # 11 Bytes
+
+# Befehle (Client -> Kamera), gleiche Namen wie die Text-Befehle
+COMMANDS = {
+    "getframe": 1,
+    "center": 2,
+    "up": 3,
+    "down": 4,
+    "left": 5,
+    "right": 6,
+    "get_pos": 7,
+    "get_limits": 8,
+    "client_count": 9,
+    "light_on": 10,
+    "light_off": 11,
+    "set_position": 12,   # a=x, b=y
+    "pos_stream": 13,     # a=1 einschalten, a=0 ausschalten
+}
+COMMAND_NAMES = {code: name for name, code in COMMANDS.items()}
+
+# Antworten und Ereignisse (Kamera -> Client)
+REPLY_POS = 64            # a=x, b=y
+REPLY_LIMITS = 65         # a=x_min, b=x_max, c=y_min, d=y_max
+REPLY_COUNT = 66          # a=Anzahl Clients
+EVENT_POS = 67            # ungefragt gesendete Position: a=x, b=y
+
+
+def pack(msg_type, a=0, b=0, c=0, d=0):
+    """
+    Packt eine Steuernachricht.
+
+    Args:
+        msg_type (int): Befehl oder Antworttyp.
+        a, b, c, d (int): Werte (int16).
+
+    Returns:
+        bytes: 11 Bytes lange Nachricht.
+    """
+    return MESSAGE.pack(MAGIC, msg_type, a, b, c, d)
+
+
+def pack_command(name, a=0, b=0):
+    """
+    Packt einen Befehl über seinen Namen (z.B. "up" oder "set_position").
+    """
+    return pack(COMMANDS[name], a, b)
+
+
+def is_control(data):
+    """
+    Prüft, ob Bytes eine Steuernachricht (und kein Bild) sind.
+    """
+    return len(data) == MESSAGE_SIZE and data[:2] == MAGIC
+
+
+def unpack(data):
+    """
+    Entpackt eine Steuernachricht.
+
+    Args:
+        data (bytes): 11 Bytes lange Nachricht.
+
+    Returns:
+        tuple: (Typ, a, b, c, d).
+    """
+    _, msg_type, a, b, c, d = MESSAGE.unpack(data)
+    return msg_type, a, b, c, d
+
+
+def decode_reply(data):
+    """
+    Wandelt eine binäre Antwort in dieselbe Form wie die JSON-Antwort um.
+
+    Returns:
+        dict oder int: Position, Limits oder Anzahl Clients.
+    """
+    msg_type, a, b, c, d = unpack(data)
+    if msg_type in (REPLY_POS, EVENT_POS):
+        return {"x": a, "y": b}
+    if msg_type == REPLY_LIMITS:
+        return {"x_min": a, "x_max": b, "y_min": c, "y_max": d}
+    if msg_type == REPLY_COUNT:
+        return a
+    raise ValueError(f"Unbekannte Antwort vom Typ {msg_type}")
@@ -0,0 +1,300 @@
+"""
++---------------------------------------------------------------+
+|          Szenen-Scan und Panorama für das SUSCam-Projekt      |
+|---------------------------------------------------------------|
+| Fährt den gesamten Schwenk-/Neigebereich der Kamera ab und    |
+| setzt die Bilder zu einem Panorama zusammen.                  |
+|                                                               |
+| - Raster aus Haltepunkten mit einstellbarer Überlappung       |
+| - Schlangenlinien-Pfad mit möglichst kurzem Gesamtweg         |
+| - Wartezeit je nach Strecke, damit das Bild nicht verwackelt  |
+| - Zusammensetzen läuft parallel zur nächsten Bewegung         |
+| - Panorama-Pixel -> Kameraposition (angle_at), um später      |
+|   direkt auf interessante Bereiche zu schwenken               |
++---------------------------------------------------------------+
+"""
+
+import asyncio
+import io
+import math
+
+import numpy as np
+from PIL import Image
+
+from tools.cam import DEFAULT_SPEED, DEFAULT_SETTLE, settle_time
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Sichtfeld der Kamera in Grad (horizontal, vertikal), ggf. an die Kamera anpassen
+DEFAULT_FOV = (60.0, 45.0)
+
+
+def _axis_stops(lo, hi, fov, overlap):
+    """
+    Interne Funktion: Gleichmäßig verteilte Haltepunkte auf einer Achse.
+    """
+    span = hi - lo
+    step = fov * (1.0 - overlap)
+    count = max(1, math.ceil(span / step) + 1) if span > 0 else 1
+    if count == 1:
+        return [int(round((lo + hi) / 2))]
+    return [int(round(lo + span * i / (count - 1))) for i in range(count)]
+
+
+def plan_scan(limits, fov=DEFAULT_FOV, overlap=0.3, start=None):
+    """
+    Plant die Haltepunkte für einen Scan als Schlangenlinie.
+
+    Gefahren wird entlang der Achse, bei der der Gesamtweg kürzer ist
+    (zeilen- oder spaltenweise). Die Schlangenlinie beginnt an der Ecke,
+    die der Startposition am nächsten liegt.
+
+    Args:
+        limits (dict): Grenzen wie von ``get_limits()`` (x_min, x_max, y_min, y_max).
+        fov (tuple): Sichtfeld (horizontal, vertikal) in Grad.
+        overlap (float): Überlappung benachbarter Bilder (0..1).
+        start (dict): Aktuelle Position (x, y), optional.
+
+    Returns:
+        list: Haltepunkte als (x, y)-Tupel.
+    """
+    xs = _axis_stops(limits["x_min"], limits["x_max"], fov[0], overlap)
+    ys = _axis_stops(limits["y_min"], limits["y_max"], fov[1], overlap)
+
+    if start is not None:
+        if abs(start["x"] - xs[-1]) < abs(start["x"] - xs[0]):
+            xs.reverse()
+        if abs(start["y"] - ys[-1]) < abs(start["y"] - ys[0]):
+            ys.reverse()
+
+    # Zeilenweise: je Zeile einmal die volle Breite, dazu einmal die Höhe (und umgekehrt)
+    width = abs(xs[-1] - xs[0])
+    height = abs(ys[-1] - ys[0])
+    by_rows = len(ys) * width + height <= len(xs) * height + width
+
+    stops = []
+    outer, inner = (ys, xs) if by_rows else (xs, ys)
+    for i, a in enumerate(outer):
+        row = inner if i % 2 == 0 else inner[::-1]
+        stops.extend((b, a) if by_rows else (a, b) for b in row)
+    return stops
+
+
+class Panorama:
+    """
+    Setzt Bilder anhand ihrer Kameraposition schrittweise zu einem Panorama zusammen.
+
+    Jedes Bild wird dort eingefügt, wo es laut Schwenk-/Neigewinkel hingehört.
+    Mit ``refine=True`` (und OpenCV) wird die Lage zusätzlich per
+    Phasenkorrelation an den schon vorhandenen Bildinhalt angepasst.
+    Überlappende Bereiche werden gemittelt.
+    """
+
+    def __init__(self, limits, frame_size, fov=DEFAULT_FOV, refine=True, invert_x=False, invert_y=False):
+        """
+        Erstellt ein leeres Panorama.
+
+        Args:
+            limits (dict): Grenzen wie von ``get_limits()``.
+            frame_size (tuple): Größe der Einzelbilder (Breite, Höhe).
+            fov (tuple): Sichtfeld (horizontal, vertikal) in Grad.
+            refine (bool): Lage per Phasenkorrelation verfeinern (nur mit OpenCV).
+            invert_x (bool): Schwenkrichtung umkehren.
+            invert_y (bool): Neigerichtung umkehren.
+        """
+        self.limits = limits
+        self.frame_w, self.frame_h = frame_size
+        self.ppd_x = self.frame_w / fov[0]   # Pixel pro Grad
+        self.ppd_y = self.frame_h / fov[1]
+        self.refine = refine and cv2 is not None
+        self.sign_x = -1 if invert_x else 1
+        self.sign_y = -1 if invert_y else 1
+
+        width = int(round((limits["x_max"] - limits["x_min"]) * self.ppd_x)) + self.frame_w
+        height = int(round((limits["y_max"] - limits["y_min"]) * self.ppd_y)) + self.frame_h
+        self._sum = np.zeros((height, width, 3), dtype=np.float32)
+        self._weight = np.zeros((height, width), dtype=np.float32)
+        self.count = 0
+
+    @property
+    def size(self):
+        """
+        Größe des Panoramas (Breite, Höhe) in Pixeln.
+        """
+        return self._weight.shape[1], self._weight.shape[0]
+
+    def _origin(self, x, y):
+        """
+        Interne Methode: Linke obere Ecke eines Bildes der Position (x, y) im Panorama.
+        """
+        dx = x - self.limits["x_min"] if self.sign_x > 0 else self.limits["x_max"] - x
+        dy = y - self.limits["y_min"] if self.sign_y > 0 else self.limits["y_max"] - y
+        return int(round(dx * self.ppd_x)), int(round(dy * self.ppd_y))
+
+    def _refine_offset(self, frame, left, top):
+        """
+        Interne Methode: Bestimmt per Phasenkorrelation, wie weit das Bild
+        gegenüber dem bisherigen Panorama verschoben ist.
+        """
+        region = (slice(top, top + self.frame_h), slice(left, left + self.frame_w))
+        weight = self._weight[region]
+        if np.count_nonzero(weight) < weight.size * 0.2:
+            return 0, 0  # zu wenig Überlappung für eine zuverlässige Schätzung
+        existing = self._sum[region] / np.maximum(weight, 1e-6)[:, :, None]
+        a = cv2.cvtColor(existing.astype(np.float32), cv2.COLOR_RGB2GRAY)
+        b = cv2.cvtColor(frame.astype(np.float32), cv2.COLOR_RGB2GRAY)
+        mask = (weight > 0).astype(np.float32)
+        (shift_x, shift_y), response = cv2.phaseCorrelate(a * mask, b * mask)
+        limit = 0.1 * max(self.frame_w, self.frame_h)
+        if response < 0.1 or abs(shift_x) > limit or abs(shift_y) > limit:
+            return 0, 0
+        return -int(round(shift_x)), -int(round(shift_y))
+
+    def add(self, img, x, y):
+        """
+        Fügt ein Bild ein, das an Position (x, y) aufgenommen wurde.
+
+        Args:
+            img (PIL.Image oder np.ndarray): RGB-Bild.
+            x (int): Schwenkposition bei der Aufnahme.
+            y (int): Neigeposition bei der Aufnahme.
+        """
+        frame = np.asarray(img.convert("RGB") if isinstance(img, Image.Image) else img)
+        if frame.shape[:2] != (self.frame_h, self.frame_w):
+            if cv2 is None:
+                frame = np.asarray(Image.fromarray(frame).resize((self.frame_w, self.frame_h)))
+            else:
+                frame = cv2.resize(frame, (self.frame_w, self.frame_h), interpolation=cv2.INTER_AREA)
+
+        left, top = self._origin(x, y)
+        if self.refine and self.count:
+            dx, dy = self._refine_offset(frame, left, top)
+            pano_w, pano_h = self.size
+            left = min(max(left + dx, 0), pano_w - self.frame_w)
+            top = min(max(top + dy, 0), pano_h - self.frame_h)
+
+        region = (slice(top, top + self.frame_h), slice(left, left + self.frame_w))
+        self._sum[region] += frame
+        self._weight[region] += 1.0
+        self.count += 1
+
+    def image(self):
+        """
+        Liefert das bisherige Panorama.
+
+        Returns:
+            PIL.Image: Panorama (nicht erfasste Bereiche sind schwarz).
+        """
+        pano = self._sum / np.maximum(self._weight, 1.0)[:, :, None]
+        return Image.fromarray(np.clip(pano, 0, 255).astype(np.uint8))
+
+    def angle_at(self, px, py):
+        """
+        Rechnet einen Punkt im Panorama in die Kameraposition um, bei der
+        dieser Punkt in der Bildmitte liegt.
+
+        Args:
+            px (int): X-Koordinate im Panorama.
+            py (int): Y-Koordinate im Panorama.
+
+        Returns:
+            dict: Position (x, y), begrenzt auf die Limits.
+        """
+        dx = (px - self.frame_w / 2) / self.ppd_x
+        dy = (py - self.frame_h / 2) / self.ppd_y
+        x = self.limits["x_min"] + dx if self.sign_x > 0 else self.limits["x_max"] - dx
+        y = self.limits["y_min"] + dy if self.sign_y > 0 else self.limits["y_max"] - dy
+        return {
+            "x": int(round(min(max(x, self.limits["x_min"]), self.limits["x_max"]))),
+            "y": int(round(min(max(y, self.limits["y_min"]), self.limits["y_max"]))),
+        }
+
+
+def _to_image(frame):
+    """
+    Interne Funktion: getframe() liefert JPEG-Bytes (Kamera) oder PIL.Image (Fallback).
+    """
+    if isinstance(frame, bytes):
+        return Image.open(io.BytesIO(frame)).convert("RGB")
+    return frame
+
+
+async def scan(cam, fov=DEFAULT_FOV, overlap=0.3, speed=DEFAULT_SPEED, settle=DEFAULT_SETTLE,
+               refine=True, return_home=True, on_progress=None, invert_x=False, invert_y=False):
+    """
+    Fährt den gesamten Bereich der Kamera ab und erstellt ein Panorama.
+
+    Während die Kamera zum nächsten Haltepunkt fährt, wird das vorige Bild
+    in einem Hintergrund-Thread dekodiert und eingefügt. Bricht der Scan
+    ab (Fehler oder Abbruch des Tasks), fährt die Kamera trotzdem zurück.
+
+    Args:
+        cam (Camera): Verbundene Kamera.
+        fov (tuple): Sichtfeld (horizontal, vertikal) in Grad.
+        overlap (float): Überlappung benachbarter Bilder (0..1).
+        speed (float): Servo-Geschwindigkeit in Grad pro Sekunde.
+        settle (float): Beruhigungszeit nach jeder Bewegung in Sekunden.
+        refine (bool): Bildlage per Phasenkorrelation verfeinern.
+        return_home (bool): Am Ende zur Ausgangsposition zurückfahren.
+        on_progress (function): Wird nach jedem Bild mit (Nummer, Anzahl, Panorama) aufgerufen.
+        invert_x (bool): Schwenkrichtung im Panorama umkehren (siehe Panorama).
+        invert_y (bool): Neigerichtung im Panorama umkehren.
+
+    Returns:
+        Panorama: Das fertige Panorama (oder None, wenn kein Bild kam).
+    """
+    limits = await cam.get_limits()
+    home = await cam.get_pos()
+    stops = plan_scan(limits, fov, overlap, start=home)
+    print(f"Scan mit {len(stops)} Haltepunkten gestartet.")
+
+    panorama = None
+    stitching = None
+
+    def stitch(frame, x, y):
+        # Läuft im Hintergrund-Thread: dekodieren und einfügen
+        nonlocal panorama
+        img = _to_image(frame)
+        if panorama is None:
+            panorama = Panorama(limits, img.size, fov=fov, refine=refine,
+                                invert_x=invert_x, invert_y=invert_y)
+        panorama.add(img, x, y)
+
+    def progress(task, n):
+        # Nur melden, wenn das Einfügen geklappt hat; Fehler kommen über await stitching
+        if not task.cancelled() and task.exception() is None:
+            on_progress(n, len(stops), panorama)
+
+    try:
+        pos = (home["x"], home["y"])
+        for i, (x, y) in enumerate(stops):
+            await cam.set_position(x, y)
+            await asyncio.sleep(settle_time(pos, (x, y), speed, settle))
+            pos = (x, y)
+
+            frame = await cam.getframe()
+            if frame is None:
+                print(f"Kein Bild an Position x={x}, y={y}.")
+                continue
+
+            # Vorheriges Einfügen abwarten, damit das Panorama nur von einem Thread verändert wird
+            if stitching is not None:
+                await stitching
+            stitching = asyncio.ensure_future(asyncio.to_thread(stitch, frame, x, y))
+            if on_progress:
+                stitching.add_done_callback(lambda task, n=i + 1: progress(task, n))
+
+        if stitching is not None:
+            await stitching
+    finally:
+        if return_home:
+            try:
+                await cam.set_position(home["x"], home["y"])
+            except Exception as e:
+                # Nicht den eigentlichen Fehler des Scans überdecken
+                print("Rückfahrt zur Ausgangsposition fehlgeschlagen:", e)
+    print("Scan abgeschlossen.")
+    return panorama
@@ -0,0 +1,234 @@
+"""
++---------------------------------------------------------------+
+|           Lokaler Kamera-Simulator für das SUSCam-Projekt     |
+|---------------------------------------------------------------|
+| Ein kleiner WebSocket-Server, der sich wie die SUSCam-Kamera  |
+| verhält – ganz ohne Hardware. Praktisch zum Testen und für    |
+| Benchmarks.                                                   |
+|                                                               |
+| - Alle Text-Befehle und JSON-Antworten der echten Kamera      |
+| - Binäres Steuerprotokoll inkl. Positions-Stream              |
+| - Sendet künstliche JPEG-Bilder mit einstellbarer Bildrate    |
+|                                                               |
+| Start:  python -m tools.simulator --port 8765                 |
+| Dann:   SUS_IP=127.0.0.1:8765                                 |
++---------------------------------------------------------------+
+"""
+
+import argparse
+import asyncio
+import io
+import json
+
+from PIL import Image, ImageDraw
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+from tools import protocol as binproto
+from tools.cam import START_POS_X, MIN_POS_X, MAX_POS_X, START_POS_Y, MIN_POS_Y, MAX_POS_Y
+
+
+class CameraSimulator:
+    """
+    Simulierte Kamera mit Schwenk-/Neigeposition, die über WebSockets
+    unter ``ws://<host>:<port>/ws`` gesteuert wird.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765, fps=10, size=(640, 480)):
+        """
+        Erstellt einen CameraSimulator.
+
+        Args:
+            host (str): Adresse, auf der der Server lauscht.
+            port (int): Port des Servers.
+            fps (float): Bilder pro Sekunde an alle Clients (0 = nur auf getframe).
+            size (tuple): Bildgröße (Breite, Höhe).
+        """
+        self.host = host
+        self.port = port
+        self.fps = fps
+        self.size = size
+        self.x = START_POS_X
+        self.y = START_POS_Y
+        self.clients = set()
+        self._binary = set()      # Clients mit binärem Protokoll
+        self._streaming = set()   # Clients mit Positions-Stream
+        self._frame = None
+        self._frame_pos = None
+
+    def frame(self):
+        """
+        Liefert ein JPEG-Bild der aktuellen Position (wird pro Position nur einmal erzeugt).
+
+        Returns:
+            bytes: JPEG-Daten.
+        """
+        if self._frame_pos != (self.x, self.y):
+            w, h = self.size
+            img = Image.new("RGB", self.size, (int(self.x / MAX_POS_X * 255), 60, int(self.y / MAX_POS_Y * 255)))
+            draw = ImageDraw.Draw(img)
+            draw.rectangle((w // 4, h // 4, 3 * w // 4, 3 * h // 4), outline=(255, 255, 255), width=3)
+            draw.text((10, 10), f"SUSCam Simulator  x={self.x} y={self.y}", fill=(255, 255, 255))
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=80)
+            self._frame = buf.getvalue()
+            self._frame_pos = (self.x, self.y)
+        return self._frame
+
+    async def _move(self, x, y):
+        """
+        Interne Methode: Setzt die Position (begrenzt) und informiert Stream-Abonnenten.
+        """
+        x = min(MAX_POS_X, max(MIN_POS_X, x))
+        y = min(MAX_POS_Y, max(MIN_POS_Y, y))
+        if (x, y) == (self.x, self.y):
+            return
+        self.x, self.y = x, y
+        event = binproto.pack(binproto.EVENT_POS, x, y)
+        for ws in list(self._streaming):
+            try:
+                await ws.send(event)
+            except ConnectionClosed:
+                pass
+
+    async def _run_command(self, ws, name, a=0, b=0):
+        """
+        Interne Methode: Führt einen Befehl aus und sendet ggf. die Antwort.
+        """
+        binary = ws in self._binary
+        if name == "getframe":
+            await ws.send(self.frame())
+        elif name == "center":
+            await self._move(START_POS_X, START_POS_Y)
+        elif name == "up":
+            await self._move(self.x, self.y - 1)
+        elif name == "down":
+            await self._move(self.x, self.y + 1)
+        elif name == "left":
+            await self._move(self.x - 1, self.y)
+        elif name == "right":
+            await self._move(self.x + 1, self.y)
+        elif name == "set_position":
+            await self._move(a, b)
+        elif name == "get_pos":
+            if binary:
+                await ws.send(binproto.pack(binproto.REPLY_POS, self.x, self.y))
+            else:
+                await ws.send(json.dumps({"x": self.x, "y": self.y}))
+        elif name == "get_limits":
+            if binary:
+                await ws.send(binproto.pack(binproto.REPLY_LIMITS, MIN_POS_X, MAX_POS_X, MIN_POS_Y, MAX_POS_Y))
+            else:
+                await ws.send(json.dumps({"x_min": MIN_POS_X, "x_max": MAX_POS_X,
+                                          "y_min": MIN_POS_Y, "y_max": MAX_POS_Y}))
+        elif name == "client_count":
+            if binary:
+                await ws.send(binproto.pack(binproto.REPLY_COUNT, len(self.clients)))
+            else:
+                await ws.send(json.dumps(len(self.clients)))
+        elif name == "pos_stream":
+            if a:
+                self._streaming.add(ws)
+                await ws.send(binproto.pack(binproto.EVENT_POS, self.x, self.y))
+            else:
+                self._streaming.discard(ws)
+        # light_on/light_off: wie bei der echten Kamera derzeit ohne Funktion
+
+    async def _on_text(self, ws, message):
+        """
+        Interne Methode: Verarbeitet Text-Befehle und JSON-Positionen.
+        """
+        if message == binproto.HELLO:
+            self._binary.add(ws)
+            await ws.send(json.dumps(binproto.HELLO_REPLY))
+            return
+        if message.startswith("{"):
+            try:
+                data = json.loads(message)
+                await self._run_command(ws, "set_position", int(data["x"]), int(data["y"]))
+            except (ValueError, KeyError, TypeError):
+                print("[Simulator] Ungültige Position:", message)
+            return
+        await self._run_command(ws, message)
+
+    async def _on_binary(self, ws, message):
+        """
+        Interne Methode: Verarbeitet binäre Steuernachrichten.
+        """
+        if not binproto.is_control(message):
+            print("[Simulator] Unbekannte Binärnachricht mit", len(message), "Bytes")
+            return
+        msg_type, a, b, _, _ = binproto.unpack(message)
+        name = binproto.COMMAND_NAMES.get(msg_type)
+        if name is None:
+            print("[Simulator] Unbekannter Befehl:", msg_type)
+            return
+        await self._run_command(ws, name, a, b)
+
+    async def _handler(self, ws):
+        """
+        Interne Methode: Bedient eine Client-Verbindung.
+        """
+        if ws.request.path != "/ws":
+            await ws.close(code=1008, reason="Pfad muss /ws sein")
+            return
+        self.clients.add(ws)
+        print(f"[Simulator] Client verbunden ({len(self.clients)} insgesamt)")
+        try:
+            async for message in ws:
+                if isinstance(message, bytes):
+                    await self._on_binary(ws, message)
+                else:
+                    await self._on_text(ws, message)
+        except ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(ws)
+            self._binary.discard(ws)
+            self._streaming.discard(ws)
+            print(f"[Simulator] Client getrennt ({len(self.clients)} verbleibend)")
+
+    async def _broadcast_frames(self):
+        """
+        Interne Methode: Sendet regelmäßig das aktuelle Bild an alle Clients.
+        """
+        while True:
+            await asyncio.sleep(1 / self.fps)
+            frame = self.frame()
+            for ws in list(self.clients):
+                try:
+                    await ws.send(frame)
+                except ConnectionClosed:
+                    pass
+
+    async def run(self, started=None):
+        """
+        Startet den Simulator und läuft, bis der Task abgebrochen wird.
+
+        Args:
+            started (asyncio.Event): Wird gesetzt, sobald der Server bereit ist.
+        """
+        async with serve(self._handler, self.host, self.port):
+            print(f"[Simulator] Läuft auf ws://{self.host}:{self.port}/ws")
+            if started is not None:
+                started.set()
+            if self.fps > 0:
+                await self._broadcast_frames()
+            else:
+                await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lokaler SUSCam-Simulator")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse (Standard: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (Standard: 8765)")
+    parser.add_argument("--fps", type=float, default=10, help="Bilder pro Sekunde, 0 = aus (Standard: 10)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(CameraSimulator(args.host, args.port, args.fps).run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
++---------------------------------------------------------------+
+|           Synchrone Kamera-Klasse für SUSCam-Projekt          |
+|---------------------------------------------------------------|
+| SyncCamera bietet dieselben Befehle wie Camera, aber ohne     |
+| async/await. Die asynchrone Camera läuft dabei in einem       |
+| eigenen Hintergrund-Thread mit eigenem Event-Loop.            |
+|                                                               |
+| - Für einfache, blockierende Skripte (time.sleep ist erlaubt) |
+| - with SyncCamera(ip) as cam: cam.right()                     |
+| - for img in cam.frames(): ...                                |
+|                                                               |
+| Callbacks laufen im Hintergrund-Thread der Kamera!            |
++---------------------------------------------------------------+
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from tools.cam import Camera, REPLY_TIMEOUT
+
+# Wie oft (Sekunden) beim Warten geprüft wird, ob der Hintergrund-Thread noch lebt
+ALIVE_CHECK_INTERVAL = 0.5
+
+
+class SyncCamera:
+    """
+    Blockierende Hülle um Camera. Jeder Aufruf wird an den Event-Loop
+    im Hintergrund-Thread übergeben und wartet auf dessen Ergebnis.
+    """
+
+    def __init__(self, ip, fallback=False, decode_scale=1):
+        """
+        Erstellt ein SyncCamera-Objekt und startet den Hintergrund-Thread.
+
+        Args:
+            ip (str): IP-Adresse der Kamera.
+            fallback (bool): Fallback-Modus aktivieren (lokale Webcam).
+            decode_scale (int): Bilder verkleinert dekodieren (1, 2, 4 oder 8).
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="SyncCamera", daemon=True)
+        self._thread.start()
+        self.cam = Camera(ip, fallback=fallback, decode_scale=decode_scale)
+
+    def _call(self, coro, timeout=None):
+        """
+        Interne Methode: Führt eine Coroutine im Hintergrund-Loop aus und wartet auf das Ergebnis.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncCamera darf nicht aus einem Kamera-Callback heraus aufgerufen werden")
+        if not self._thread.is_alive() or self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("Hintergrund-Thread der SyncCamera läuft nicht mehr")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = ALIVE_CHECK_INTERVAL
+            if deadline is not None:
+                wait = max(0.0, min(wait, deadline - time.monotonic()))
+            try:
+                return future.result(wait)
+            except concurrent.futures.TimeoutError:
+                if future.done():
+                    raise  # TimeoutError kam aus der Coroutine selbst
+                if not self._thread.is_alive():
+                    future.cancel()
+                    raise RuntimeError("Hintergrund-Thread der SyncCamera wurde beendet")
+                if deadline is not None and time.monotonic() >= deadline:
+                    future.cancel()
+                    raise
+
+    def __enter__(self):
+        """
+        Verbindet beim Betreten von ``with SyncCamera(...) as cam``.
+        """
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """
+        Schließt die Verbindung beim Verlassen des ``with``-Blocks.
+        """
+        self.close()
+
+    def set_img_callback(self, callback):
+        """
+        Setzt die Callback-Funktion für empfangene Bilder (läuft im Hintergrund-Thread).
+        """
+        self.cam.set_img_callback(callback)
+
+    def set_msg_callback(self, callback):
+        """
+        Setzt die Callback-Funktion für empfangene Nachrichten (läuft im Hintergrund-Thread).
+        """
+        self.cam.set_msg_callback(callback)
+
+    def connect(self):
+        """
+        Stellt die Verbindung zur Kamera her (oder startet Fallback).
+        """
+        self._call(self.cam.connect())
+
+    def close(self):
+        """
+        Schließt die Verbindung und beendet den Hintergrund-Thread.
+        """
+        if not self._thread.is_alive():
+            if not self._loop.is_closed():
+                self._loop.close()
+            return
+        try:
+            self._call(self.cam.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def frames(self, maxsize=1):
+        """
+        Blockierender Iterator über empfangene Bilder. Endet, wenn die
+        Kamera geschlossen wird.
+
+        Yields:
+            PIL.Image: Empfangene Bilder.
+        """
+        agen = self.cam.frames(maxsize=maxsize)
+        try:
+            while True:
+                try:
+                    img = self._call(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield img
+        finally:
+            if self._thread.is_alive():
+                self._call(agen.aclose())
+
+    def getframe(self):
+        """
+        Fordert ein aktuelles Bild von der Kamera an.
+        """
+        return self._call(self.cam.getframe(), REPLY_TIMEOUT + 1)
+
+    def get_full_image(self):
+        """
+        Liefert das zuletzt empfangene Bild in voller Auflösung.
+        """
+        return self.cam.get_full_image()
+
+    def center(self):
+        """
+        Zentriert die Kamera.
+        """
+        self._call(self.cam.center())
+
+    def up(self):
+        """
+        Bewegt die Kamera nach oben.
+        """
+        self._call(self.cam.up())
+
+    def down(self):
+        """
+        Bewegt die Kamera nach unten.
+        """
+        self._call(self.cam.down())
+
+    def left(self):
+        """
+        Bewegt die Kamera nach links.
+        """
+        self._call(self.cam.left())
+
+    def right(self):
+        """
+        Bewegt die Kamera nach rechts.
+        """
+        self._call(self.cam.right())
+
+    def set_position(self, x, y):
+        """
+        Setzt die Kamera auf eine bestimmte Position.
+        """
+        self._call(self.cam.set_position(x, y))
+
+    def get_pos(self):
+        """
+        Fragt die aktuelle Position der Kamera ab.
+        """
+        return self._call(self.cam.get_pos(), REPLY_TIMEOUT + 1)
+
+    def get_limits(self):
+        """
+        Fragt die Positionsgrenzen der Kamera ab.
+        """
+        return self._call(self.cam.get_limits(), REPLY_TIMEOUT + 1)
+
+    def client_count(self):
+        """
+        Fragt die Anzahl der verbundenen Clients ab.
+        """
+        return self._call(self.cam.client_count(), REPLY_TIMEOUT + 1)
+
+    def light_on(self):
+        """
+        Schaltet das Licht der Kamera ein.
+        """
+        self._call(self.cam.light_on())
+
+    def light_off(self):
+        """
+        Schaltet das Licht der Kamera aus.
+        """
+        self._call(self.cam.light_off())
+
+    def is_fallback(self):
+        """
+        Gibt zurück, ob der Fallback-Modus aktiv ist.
+        """
+        return self.cam.is_fallback()
@@ -0,0 +1,164 @@
+"""
++---------------------------------------------------------------+
+|          Virtuelle Kamera-Ausgabe für das SUSCam-Projekt      |
+|---------------------------------------------------------------|
+| Stellt bearbeitete Bilder (z.B. mit markierten Gesichtern)    |
+| als virtuelle Webcam bereit (pyvirtualcam, unter Linux über   |
+| v4l2loopback). Videokonferenz-Tools, OBS & Co. können den     |
+| Stream dann wie eine normale Kamera nutzen.                   |
+|                                                               |
+| - Feste Ausgabe-Bildrate: fehlende Bilder werden wiederholt,  |
+|   zu viele Bilder verworfen (immer das neueste zählt)         |
+| - Drei vorab angelegte Puffer, keine Speicheranlage pro Bild  |
++---------------------------------------------------------------+
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    import pyvirtualcam
+except ImportError:
+    pyvirtualcam = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+class VirtualCamSink:
+    """
+    Gibt Bilder mit fester Bildrate an eine virtuelle Kamera aus.
+
+    ``push()`` kann beliebig oft (und aus dem Event-Loop) aufgerufen werden
+    und blockiert nicht; ein eigener Thread sendet im Takt der Bildrate
+    jeweils das neueste Bild. Intern wird dreifach gepuffert: ein Puffer
+    wird beschrieben, einer hält das neueste fertige Bild, einer wird gesendet.
+    """
+
+    def __init__(self, width=640, height=480, fps=20, device=None, backend=None):
+        """
+        Erstellt eine VirtualCamSink.
+
+        Args:
+            width (int): Breite der virtuellen Kamera.
+            height (int): Höhe der virtuellen Kamera.
+            fps (float): Ausgabe-Bildrate.
+            device (str): Gerät, z.B. "/dev/video10" (None = automatisch).
+            backend (str): pyvirtualcam-Backend, z.B. "v4l2loopback" (None = automatisch).
+        """
+        if pyvirtualcam is None:
+            raise RuntimeError("pyvirtualcam nicht installiert, virtuelle Kamera nicht verfügbar.")
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.device = device
+        self.backend = backend
+
+        # Dreifachpuffer (RGB) plus Hilfspuffer für Größenänderung mit BGR-Eingang
+        self._buffers = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(3)]
+        self._scratch = np.zeros((height, width, 3), dtype=np.uint8)
+        self._back, self._latest, self._front = 0, 1, 2
+        self._new = False
+        self._lock = threading.Lock()
+
+        self._cam = None
+        self._thread = None
+        self._running = False
+        self._sent = 0
+        self._duplicated = 0
+        self._dropped = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """
+        Öffnet die virtuelle Kamera und startet den Sende-Thread.
+
+        Returns:
+            VirtualCamSink: self, für ``sink = VirtualCamSink(...).start()``.
+        """
+        self._cam = pyvirtualcam.Camera(
+            width=self.width, height=self.height, fps=self.fps,
+            fmt=pyvirtualcam.PixelFormat.RGB, device=self.device, backend=self.backend,
+        )
+        print(f"Virtuelle Kamera gestartet: {self._cam.device} ({self.width}x{self.height} @ {self.fps} FPS)")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="VirtualCamSink", daemon=True)
+        self._thread.start()
+        return self
+
+    def push(self, frame, bgr=False):
+        """
+        Übergibt ein neues Bild. Hat die Größe nicht gepasst, wird skaliert.
+
+        Args:
+            frame (np.ndarray oder PIL.Image): Bild (H, W, 3), uint8.
+            bgr (bool): True für OpenCV-Bilder (BGR), sonst RGB.
+        """
+        frame = np.asarray(frame)
+        buf = self._buffers[self._back]
+        same_size = frame.shape[:2] == (self.height, self.width)
+
+        if same_size and not bgr:
+            np.copyto(buf, frame)
+        elif cv2 is None:
+            if not same_size:
+                raise RuntimeError("OpenCV nicht verfügbar, Bildgröße muss zur virtuellen Kamera passen.")
+            np.copyto(buf, frame[:, :, ::-1])
+        elif same_size:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+        elif bgr:
+            cv2.resize(frame, (self.width, self.height), dst=self._scratch, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._scratch, cv2.COLOR_BGR2RGB, dst=buf)
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=buf, interpolation=cv2.INTER_AREA)
+
+        with self._lock:
+            if self._new:
+                self._dropped += 1  # vorheriges Bild wurde nie gesendet
+            self._back, self._latest = self._latest, self._back
+            self._new = True
+
+    def _run(self):
+        """
+        Interne Methode: Sendet im Takt der Bildrate das jeweils neueste Bild.
+        """
+        while self._running:
+            with self._lock:
+                if self._new:
+                    self._front, self._latest = self._latest, self._front
+                    self._new = False
+                else:
+                    self._duplicated += 1  # kein neues Bild: letztes wiederholen
+            self._cam.send(self._buffers[self._front])
+            self._sent += 1
+            self._cam.sleep_until_next_frame()
+
+    def stop(self):
+        """
+        Beendet den Sende-Thread und schließt die virtuelle Kamera.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._cam is not None:
+            self._cam.close()
+            self._cam = None
+            print("Virtuelle Kamera geschlossen.")
+
+    def stats(self):
+        """
+        Gibt zurück, wie viele Bilder gesendet, wiederholt und verworfen wurden.
+
+        Returns:
+            dict: sent, duplicated, dropped.
+        """
+        return {"sent": self._sent, "duplicated": self._duplicated, "dropped": self._dropped}